@@ -1,20 +1,23 @@
 from flask import Flask
 from config import Config
+from app.utils.json_provider import ORJSONProvider
 from app.extensions import db, migrate, socketio
+from app.extensions.db import _register_models
 
 def create_app():
     app = Flask(__name__)
+    app.json = ORJSONProvider(app)
 
     # Load config from Config class
     app.config.from_object(Config)
 
     # Initialize extensions
     db.init_app(app)
+    _register_models()
     migrate.init_app(app, db)
     socketio.init_app(app)
 
-    # Initialize Redis connection (imported for side effects - connection test)
-    from app.extensions import redis_conn, task_queue
+    # Redis connects lazily on first use of app.extensions.redis_conn/task_queue
 
     # Create database tables
     with app.app_context():
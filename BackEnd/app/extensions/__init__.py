@@ -1,5 +1,18 @@
+from typing import TYPE_CHECKING
+
 from .db import db, migrate
-from .redis_client import redis_conn, task_queue
 from .socketio_server import socketio
 
-__all__ = ['db', 'migrate', 'redis_conn', 'task_queue', 'socketio']
+if TYPE_CHECKING:
+    from .redis_client import redis_conn, task_queue, ingest_queue, analysis_queue
+
+__all__ = ['db', 'migrate', 'redis_conn', 'task_queue', 'ingest_queue', 'analysis_queue', 'socketio']
+
+
+def __getattr__(name):
+    # Redis/RQ are only imported (and connected) on first use, so importing
+    # app.extensions stays cheap for the reloader, migrations and workers.
+    if name in ('redis_conn', 'task_queue', 'ingest_queue', 'analysis_queue'):
+        from . import redis_client
+        return getattr(redis_client, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -26,6 +26,6 @@ case_status_enum = PgEnum(
     values_callable=lambda enum: [e.value for e in enum]
 )
 
-# Import models after db is defined to avoid circular imports
-from app.models.case import Case
-from app.models.casefile import CaseFile
+def _register_models():
+    """Import models so they are registered on db.metadata (called from create_app)."""
+    import app.models  # noqa: F401
@@ -1,6 +1,6 @@
 """
 Redis client and RQ queue initialization.
-This module sets up the Redis connection and creates the job queue.
+This module sets up the Redis connection and creates the job queues.
 """
 import redis
 from rq import Queue
@@ -8,10 +8,23 @@ from config import Config
 
 # Initialize Redis connection
 try:
-    redis_conn = redis.from_url(
+    # Shared, bounded pool: callers wait up to `timeout` seconds for a free
+    # connection instead of opening new sockets under load. Replies stay
+    # bytes (no per-reply UTF-8 decode); callers decode at the API boundary.
+    # Keepalive plus a periodic health check keep idle pooled sockets (the
+    # worker's BLPOP and pub-sub connections) usable across network blips
+    # instead of failing and reconnecting on the next command.
+    redis_pool = redis.BlockingConnectionPool.from_url(
         Config.REDIS_URL,
-        socket_connect_timeout=5
+        max_connections=Config.REDIS_MAX_CONNECTIONS,
+        timeout=5,
+        socket_connect_timeout=5,
+        socket_keepalive=True,
+        health_check_interval=30,
+        retry_on_timeout=True,
+        decode_responses=False
     )
+    redis_conn = redis.Redis(connection_pool=redis_pool)
     # Test connection
     redis_conn.ping()
     print("✓ Redis connected successfully")
@@ -20,8 +33,20 @@ except redis.ConnectionError as e:
     print("  Make sure Redis server is running on localhost:6381")
     redis_conn = None
 
-# Create RQ Queue for forensics analysis tasks
-task_queue = Queue(
+# Separate queues per job class so each can get its own worker pool:
+# ingest (checksums) is short and CPU/IO-bound, analysis (Volatility
+# plugin runs) is long and memory-bound
+ingest_queue = Queue(
+    name=Config.RQ_INGEST_QUEUE_NAME,
+    connection=redis_conn,
+    default_timeout='1h'
+) if redis_conn else None
+
+analysis_queue = Queue(
     name=Config.RQ_QUEUE_NAME,
-    connection=redis_conn
+    connection=redis_conn,
+    default_timeout='4h'
 ) if redis_conn else None
+
+# Backwards-compatible alias for the analysis queue
+task_queue = analysis_queue
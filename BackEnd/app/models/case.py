@@ -30,8 +30,12 @@ class Case(db.Model):
             "description": self.description,
             "status": self.status,
             "priority": self.priority,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
             "metadata": self.case_metadata,
             "files": [file.to_dict() for file in self.files] if self.files else []
         }
+
+
+# Composite index backing keyset pagination in get_all_cases
+db.Index('ix_cases_created_id', Case.created_at.desc(), Case.id.desc())
@@ -11,6 +11,7 @@ class CaseFile(db.Model):
     file_path = db.Column(db.String(512), nullable=False)
     file_size = db.Column(db.BigInteger, nullable=False)
     checksum = db.Column(db.String(128), nullable=False)
+    checksum_algo = db.Column(db.String(32), nullable=False, default='sha256', server_default='sha256')
     mime_type = db.Column(db.String(100))
     stored_at = db.Column(db.DateTime, nullable=False, server_default=func.now())
     report_path = db.Column(db.String(512))
@@ -30,8 +31,9 @@ class CaseFile(db.Model):
             "file_path": self.file_path,
             "file_size": self.file_size,
             "checksum": self.checksum,
+            "checksum_algo": self.checksum_algo,
             "mime_type": self.mime_type,
-            "stored_at": self.stored_at.isoformat() if self.stored_at else None,
+            "stored_at": self.stored_at,
             "report_path": self.report_path,
             "notes": self.notes
         }
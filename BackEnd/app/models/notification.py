@@ -32,5 +32,5 @@ class Notification(db.Model):
             "title": self.title,
             "message": self.message,
             "is_read": self.is_read,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "created_at": self.created_at,
         }
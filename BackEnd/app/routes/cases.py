@@ -2,22 +2,55 @@ import os
 import uuid
 import hashlib
 from datetime import datetime
-from flask import Blueprint, request, jsonify, current_app
+from flask import Blueprint, request, jsonify, current_app, Response, abort
 from werkzeug.utils import secure_filename
+from sqlalchemy import select, tuple_
+from sqlalchemy.orm import selectinload
 from sqlalchemy.exc import SQLAlchemyError
-from app.extensions import db, task_queue
+from app.extensions import db
 from app.models import Case, CaseFile
+from app.services.file_service import save_upload, adopt_upload
+from app.services.case_cache import cached_case_json
 
 # Initialize Blueprint
 cases_bp = Blueprint("cases", __name__)
 
 # Allowed file extensions for memory dumps
 ALLOWED_EXTENSIONS = {'raw', 'mem', 'vmem', 'bin'}
+_ALLOWED_SUFFIXES = tuple('.' + ext for ext in ALLOWED_EXTENSIONS)
 
 def allowed_file(filename):
     """Check if the file has an allowed extension"""
-    return '.' in filename and \
-           filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+    return filename.lower().endswith(_ALLOWED_SUFFIXES)
+
+def get_offloaded_upload_path():
+    """Return the path of an upload the proxy already spooled to disk, or None"""
+    incoming_dir = current_app.config.get('UPLOAD_INCOMING_DIR')
+    tmp_path = request.headers.get('X-Upload-Tmp-Path')
+    if not incoming_dir or not tmp_path:
+        return None
+
+    # Only honour paths inside the proxy's spool directory
+    incoming_dir = os.path.realpath(incoming_dir)
+    tmp_path = os.path.realpath(tmp_path)
+    if os.path.commonpath([incoming_dir, tmp_path]) != incoming_dir or not os.path.isfile(tmp_path):
+        return None
+    return tmp_path
+
+def discard_offloaded_upload(tmp_path):
+    """
+    Delete a spooled upload that was not adopted into a case.
+
+    Called after every upload request: once the file has been moved into
+    its case directory this is a no-op, otherwise (validation failure or
+    error) it keeps rejected uploads from piling up in the spool directory.
+    """
+    try:
+        os.remove(tmp_path)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        current_app.logger.warning(f"Could not remove spooled upload {tmp_path}: {e}")
 
 def create_case_directory(case_id):
     """Create directory structure for a new case"""
@@ -25,14 +58,10 @@ def create_case_directory(case_id):
     os.makedirs(case_dir, exist_ok=True)
     return case_dir
 
-def calculate_checksum(file_path):
-    """Calculate SHA-256 checksum of a file"""
-    sha256_hash = hashlib.sha256()
-    with open(file_path, 'rb') as f:
-        # Read and update hash in chunks of 4K
-        for byte_block in iter(lambda: f.read(4096), b""):
-            sha256_hash.update(byte_block)
-    return sha256_hash.hexdigest()
+def parse_cursor(cursor):
+    """Parse a keyset pagination cursor of the form '<created_at ISO>,<id>'"""
+    created_at, _, case_id = cursor.rpartition(',')
+    return datetime.fromisoformat(created_at), int(case_id)
 
 @cases_bp.route("", methods=["GET"])
 def get_all_cases():
@@ -53,6 +82,15 @@ def get_all_cases():
         required: false
         default: 1
         description: Page number for pagination
+      - name: cursor
+        in: query
+        type: string
+        required: false
+        description: >
+          Keyset pagination cursor ('<created_at>,<id>' from next_cursor).
+          When present (even empty, for the first page) page/total are
+          skipped and rows are fetched with an indexed range scan instead
+          of LIMIT/OFFSET
       - name: limit
         in: query
         type: integer
@@ -62,11 +100,14 @@ def get_all_cases():
     responses:
       200:
         description: List of cases
+      400:
+        description: Invalid cursor
     """
     try:
         # Get query parameters
         status = request.args.get('status')
         page = request.args.get('page', 1, type=int)
+        cursor = request.args.get('cursor')
         limit = request.args.get('limit', 10, type=int)
         
         # Validate pagination parameters
@@ -75,15 +116,41 @@ def get_all_cases():
         if limit < 1 or limit > 100:
             limit = 10
         
-        # Build query
-        query = Case.query
+        # Build query (files loaded in one extra IN query, not one per case)
+        query = Case.query.options(selectinload(Case.files))
         
         # Apply status filter if provided
         if status:
             query = query.filter_by(status=status)
         
-        # Order by created_at descending (newest first)
-        query = query.order_by(Case.created_at.desc())
+        # Order by created_at descending (newest first), id as tie-breaker
+        query = query.order_by(Case.created_at.desc(), Case.id.desc())
+        
+        if cursor is not None:
+            # Keyset pagination: no OFFSET scan and no COUNT(*)
+            if cursor:
+                try:
+                    cursor_ts, cursor_id = parse_cursor(cursor)
+                except ValueError:
+                    return jsonify({"error": "Invalid cursor"}), 400
+                query = query.filter(tuple_(Case.created_at, Case.id) < (cursor_ts, cursor_id))
+            
+            # Fetch one extra row to know whether another page exists
+            rows = query.limit(limit + 1).all()
+            has_next = len(rows) > limit
+            rows = rows[:limit]
+            next_cursor = (
+                f"{rows[-1].created_at.isoformat()},{rows[-1].id}" if has_next else None
+            )
+            
+            return jsonify({
+                "cases": [case.to_dict() for case in rows],
+                "pagination": {
+                    "limit": limit,
+                    "has_next": has_next,
+                    "next_cursor": next_cursor
+                }
+            }), 200
         
         # Get total count before pagination
         total = query.count()
@@ -143,18 +210,35 @@ def upload_case():
       400:
         description: Invalid file or missing parameters
     """
-    # Check if the post request has the file part
-    if 'file' not in request.files:
-        return jsonify({"error": "No file part in request"}), 400
-    
-    file = request.files['file']
-    
+    # The proxy may already have written the file part to disk for us
+    incoming_path = get_offloaded_upload_path()
+    try:
+        return _create_case_from_upload(incoming_path)
+    finally:
+        if incoming_path:
+            discard_offloaded_upload(incoming_path)
+
+def _create_case_from_upload(incoming_path):
+    """Validate the upload, store the dump and create its case (see upload_case)"""
+    if incoming_path:
+        file = None
+        original_filename = request.headers.get('X-Upload-Filename', '')
+        mimetype = request.headers.get('X-Upload-Content-Type')
+    else:
+        # Check if the post request has the file part
+        if 'file' not in request.files:
+            return jsonify({"error": "No file part in request"}), 400
+
+        file = request.files['file']
+        original_filename = file.filename
+        mimetype = file.mimetype
+
     # Check if file is empty
-    if file.filename == '':
+    if original_filename == '':
         return jsonify({"error": "No selected file"}), 400
-    
+
     # Validate file extension
-    if not (file and allowed_file(file.filename)):
+    if not allowed_file(original_filename):
         return jsonify({
             "error": "Invalid file type",
             "allowed_extensions": list(ALLOWED_EXTENSIONS)
@@ -173,16 +257,14 @@ def upload_case():
         return jsonify({"error": "Priority must be between 1 and 10"}), 400
     
     try:
-        # Start a database transaction
-        db.session.begin()
-        
-        # Create case directory
+        # No explicit begin(): the session autobegins on first use, and the
+        # commit below (or the rollback in the handlers) ends the transaction
         case = Case(
             name=case_name,
             description=description,
             priority=priority,
             status='queued',
-            case_metadata={"original_filename": file.filename}
+            case_metadata={"original_filename": original_filename}
         )
         
         # Add to session to generate ID
@@ -193,21 +275,27 @@ def upload_case():
         case_dir = create_case_directory(case.id)
         
         # Save the file
-        filename = secure_filename(file.filename)
+        filename = secure_filename(original_filename)
         file_extension = os.path.splitext(filename)[1].lower()
         file_path = os.path.join(case_dir, f'raw{file_extension}')
-        file.save(file_path)
-        
-        # Checksum is deferred to the worker task for faster upload response
+        # Optionally hash while writing so the dump is only read once;
+        # otherwise the checksum is filled in by the ingest worker task
+        compute_checksum = current_app.config['CHECKSUM_ON_UPLOAD']
+        if incoming_path:
+            # Proxy already spooled the body: rename it instead of copying
+            file_size, checksum = adopt_upload(incoming_path, file_path, compute_checksum)
+        else:
+            file_size, checksum = save_upload(file, file_path, compute_checksum)
+        checksum = checksum or 'pending'
         
         # Create case file record
         case_file = CaseFile(
             case_id=case.id,
             file_path=file_path,
-            file_size=os.path.getsize(file_path),
-            checksum='pending',
-            mime_type=file.mimetype or 'application/octet-stream',
-            notes=f"Original filename: {file.filename}"
+            file_size=file_size,
+            checksum=checksum,
+            mime_type=mimetype or 'application/octet-stream',
+            notes=f"Original filename: {original_filename}"
         )
         
         db.session.add(case_file)
@@ -217,24 +305,35 @@ def upload_case():
         
         # ========== JOB ENQUEUE LOGIC ==========
         # After successful file upload and database commit,
-        # enqueue the analysis job to Redis Queue
+        # enqueue the ingest (checksum) and analysis jobs to their Redis Queues
         job = None
         job_id = None
         
-        if task_queue:
+        from app.extensions import redis_conn, ingest_queue, analysis_queue
+        if analysis_queue:
             try:
-                # Import the task function
-                from app.tasks import analyze_memory_dump
+                from rq import Queue
+                # Import the task functions
+                from app.tasks import analyze_memory_dump, ingest_memory_dump
+                
+                # Maximum execution time comes from each queue's default_timeout
+                def job_data(task):
+                    return Queue.prepare_data(
+                        task,                 # Function to execute
+                        args=(case.id,),      # Argument: case_id
+                        result_ttl=86400,     # Keep result for 24 hours
+                        failure_ttl=86400     # Keep failure info for 24 hours
+                    )
                 
-                # Enqueue the job with case_id as the only parameter
-                # The worker will pick this up and process it asynchronously
-                job = task_queue.enqueue(
-                    analyze_memory_dump,  # Function to execute
-                    case.id,              # Argument: case_id
-                    job_timeout='2h',     # Maximum execution time (2 hours)
-                    result_ttl=86400,     # Keep result for 24 hours
-                    failure_ttl=86400     # Keep failure info for 24 hours
-                )
+                # Both queues are written in a single Redis pipeline
+                # The workers will pick the jobs up and process them asynchronously
+                with redis_conn.pipeline() as pipe:
+                    # Pending checksums get an ingest job alongside the analysis;
+                    # the two are independent (the CLI hashes the dump itself)
+                    if checksum == 'pending':
+                        ingest_queue.enqueue_many([job_data(ingest_memory_dump)], pipeline=pipe)
+                    job = analysis_queue.enqueue_many([job_data(analyze_memory_dump)], pipeline=pipe)[0]
+                    pipe.execute()
                 
                 job_id = job.id
                 current_app.logger.info(f"Enqueued analysis job {job_id} for case {case.id}")
@@ -244,7 +343,7 @@ def upload_case():
                 # The case is already created, user can retry analysis later
                 current_app.logger.error(f"Failed to enqueue job for case {case.id}: {str(e)}")
         else:
-            current_app.logger.warning("Task queue not available - job not enqueued")
+            current_app.logger.warning("Task queues not available - jobs not enqueued")
         
         # Return success response with job information
         response_data = {
@@ -288,11 +387,21 @@ def get_case(case_id):
     responses:
       200:
         description: Case details
+      304:
+        description: Case unchanged since the ETag sent in If-None-Match
       404:
         description: Case not found
     """
-    case = Case.query.get_or_404(case_id)
-    return jsonify({"case": case.to_dict()})
+    # None for a missing case (nothing is cached for it), so the ETag below
+    # is only built for a case that exists
+    body = cached_case_json(case_id)
+    if body is None:
+        abort(404)
+
+    response = Response(body, mimetype='application/json')
+    response.set_etag(hashlib.sha1(body.encode('utf-8')).hexdigest())
+    # Turns the response into a bodyless 304 when If-None-Match matches
+    return response.make_conditional(request)
 
 @cases_bp.route("/<int:case_id>/status", methods=["GET"])
 def get_case_status(case_id):
@@ -313,11 +422,16 @@ def get_case_status(case_id):
       404:
         description: Case not found
     """
-    case = Case.query.get_or_404(case_id)
+    # Only the two columns pollers need; no metadata/description hydration
+    row = db.session.execute(
+        select(Case.status, Case.updated_at).where(Case.id == case_id)
+    ).one_or_none()
+    if row is None:
+        abort(404)
     return jsonify({
         "case_id": case_id,
-        "status": case.status,
-        "updated_at": case.updated_at.isoformat() if case.updated_at else None
+        "status": row.status,
+        "updated_at": row.updated_at.isoformat() if row.updated_at else None
     })
 
 @cases_bp.route("/<int:case_id>/report", methods=["GET"])
@@ -325,12 +439,19 @@ def get_case_report(case_id):
     """
     Get analysis report for a case — reads the real report.json.
     """
-    case = Case.query.get_or_404(case_id)
-    case_file = CaseFile.query.filter_by(case_id=case_id).first()
+    # One round-trip for just the columns used below
+    case = db.session.execute(
+        select(Case.name, Case.status, CaseFile.file_path)
+        .outerjoin(CaseFile, CaseFile.case_id == Case.id)
+        .where(Case.id == case_id)
+        .limit(1)
+    ).one_or_none()
+    if case is None:
+        abort(404)
 
     # Find report.json in the case directory
-    if case_file:
-        case_dir = os.path.dirname(case_file.file_path)
+    if case.file_path:
+        case_dir = os.path.dirname(case.file_path)
         report_path = os.path.join(case_dir, 'report.json')
     else:
         return jsonify({"error": "No files found for this case"}), 404
@@ -424,22 +545,36 @@ def get_case_stages(case_id):
     Get analysis pipeline stages + analysis logs for the case view screen.
     Derives stages from report.json performance data and case status.
     """
-    case = Case.query.get_or_404(case_id)
-    case_file = CaseFile.query.filter_by(case_id=case_id).first()
+    # Postgres extracts original_filename (->>) so the JSONB blob isn't shipped
+    case = db.session.execute(
+        select(
+            Case.name,
+            Case.status,
+            Case.created_at,
+            Case.case_metadata['original_filename'].astext.label('original_filename'),
+            CaseFile.file_path,
+            CaseFile.file_size,
+        )
+        .outerjoin(CaseFile, CaseFile.case_id == Case.id)
+        .where(Case.id == case_id)
+        .limit(1)
+    ).one_or_none()
+    if case is None:
+        abort(404)
 
     # Define pipeline stages
     pipeline = [
         {"key": "file_upload", "name": "File Upload", "description": "Validating and storing memory dump"},
         {"key": "format_detection", "name": "Format Detection", "description": "Identifying memory dump format"},
-        {"key": "hashing", "name": "File Hashing", "description": "Computing MD5, SHA1, SHA256 hashes"},
+        {"key": "hashing", "name": "File Hashing", "description": "Computing SHA256 hash"},
         {"key": "os_detection", "name": "OS Detection", "description": "Detecting operating system"},
         {"key": "plugin_execution", "name": "Plugin Execution", "description": "Running Volatility3 plugins"},
         {"key": "report_generation", "name": "Report Generation", "description": "Generating analysis report"},
     ]
 
     report_data = None
-    if case_file:
-        case_dir = os.path.dirname(case_file.file_path)
+    if case.file_path:
+        case_dir = os.path.dirname(case.file_path)
         report_path = os.path.join(case_dir, 'report.json')
         if os.path.exists(report_path):
             import json as json_lib
@@ -523,7 +658,7 @@ def get_case_stages(case_id):
                 secs = int(elapsed % 60)
                 t_str = f"{base_time.hour:02}:{base_time.minute + minutes:02}:{secs:02}"
                 hashes = file_info.get('hashes', {})
-                logs.append({"time": t_str, "message": f"Hashing complete. MD5: {(hashes.get('md5', '')[:16])}..."})
+                logs.append({"time": t_str, "message": f"Hashing complete. SHA256: {(hashes.get('sha256', '')[:16])}..."})
 
             os_info = report_data.get('os_detection', {})
             if os_info.get('operating_system'):
@@ -577,8 +712,8 @@ def get_case_stages(case_id):
         "case_id": case_id,
         "case_name": case.name,
         "status": case.status,
-        "file_name": case.case_metadata.get('original_filename', 'Unknown') if case.case_metadata else 'Unknown',
-        "file_size": case_file.file_size if case_file else 0,
+        "file_name": case.original_filename or 'Unknown',
+        "file_size": case.file_size or 0,
         "created_at": case.created_at.isoformat() if case.created_at else None,
         "overall_progress": round(overall_progress, 2),
         "total_time": report_data.get('performance', {}).get('total_time') if report_data else None,
@@ -0,0 +1,74 @@
+"""
+Read-through Redis cache for serialized case JSON.
+
+Case rows only change on upload and on worker state transitions, so polling
+clients can be served from Redis; the worker invalidates the entry whenever
+it commits a change.
+
+Each case has a generation counter that invalidation bumps. Cached bodies
+are tagged with the generation read *before* the row was loaded, so a
+reader that loaded the row before a commit can't re-publish stale JSON
+after the invalidation: its tag no longer matches and the entry is ignored.
+"""
+from flask import current_app
+from sqlalchemy.orm import selectinload
+from app.extensions import db
+from app.models import Case
+
+
+def _cache_key(case_id):
+    return f"case:{case_id}:json"
+
+
+def _generation_key(case_id):
+    return f"case:{case_id}:gen"
+
+
+def cached_case_json(case_id):
+    """
+    Return the serialized ``{"case": ...}`` body for a case, or None if the
+    case does not exist. Falls back to the database when Redis is unavailable.
+    """
+    from app.extensions import redis_conn
+
+    key = _cache_key(case_id)
+    generation = b"0"
+    if redis_conn:
+        try:
+            # One round trip for the current generation and the entry
+            current, cached = redis_conn.mget(_generation_key(case_id), key)
+            generation = current or b"0"
+            if cached is not None:
+                tag, sep, body = cached.partition(b"\n")
+                if sep and tag == generation:
+                    return body.decode('utf-8')
+        except Exception as e:
+            current_app.logger.warning(f"Case cache read failed for case {case_id}: {e}")
+
+    case = db.session.get(Case, case_id, options=[selectinload(Case.files)])
+    if not case:
+        return None
+
+    body = current_app.json.dumps({"case": case.to_dict()})
+    if redis_conn:
+        try:
+            redis_conn.setex(key, current_app.config['CASE_CACHE_TTL'],
+                             generation + b"\n" + body.encode('utf-8'))
+        except Exception as e:
+            current_app.logger.warning(f"Case cache write failed for case {case_id}: {e}")
+    return body
+
+
+def invalidate_case(case_id):
+    """Drop the cached JSON for a case after its row (or its files) changed."""
+    from app.extensions import redis_conn
+
+    if not redis_conn:
+        return
+    try:
+        pipe = redis_conn.pipeline(transaction=False)
+        pipe.incr(_generation_key(case_id))
+        pipe.delete(_cache_key(case_id))
+        pipe.execute()
+    except Exception as e:
+        current_app.logger.warning(f"Case cache invalidation failed for case {case_id} (non-critical): {e}")
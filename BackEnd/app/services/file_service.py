@@ -0,0 +1,127 @@
+"""
+File handling service — checksums and on-disk storage helpers for memory dumps.
+"""
+import os
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from app.utils.file_io import open_readonly_mmap
+
+# Read size used when streaming a dump through a hasher (1 MiB)
+CHECKSUM_CHUNK_SIZE = 1 << 20
+
+# Tree checksum: SHA-256 over the concatenated SHA-256 digests of each 64 MiB part
+TREE_PART_SIZE = 64 << 20
+TREE_CHECKSUM_ALGO = 'sha256-tree-64M'
+
+
+def _fadvise(f, advice, offset=0, length=0):
+    """Pass a page-cache hint such as 'POSIX_FADV_DONTNEED'; no-op where unsupported (Windows, macOS)."""
+    if hasattr(os, 'posix_fadvise'):
+        os.posix_fadvise(f.fileno(), offset, length, getattr(os, advice))
+
+
+def calculate_checksum(file_path):
+    """
+    Calculate SHA-256 checksum of a file.
+
+    hashlib.new() goes through OpenSSL's EVP interface, which dispatches to
+    the SHA-NI / ARMv8 SHA2 instructions on CPUs that support them.
+
+    The read is advised as sequential (larger readahead) and the pages are
+    dropped afterwards, so hashing a multi-GB dump doesn't evict the
+    database's working set from the page cache.
+    """
+    with open(file_path, 'rb') as f:
+        _fadvise(f, 'POSIX_FADV_SEQUENTIAL')
+        try:
+            # Hash the whole mapping in one update: no per-chunk copies into
+            # userspace, and the GIL is released for the entire pass
+            mapped = open_readonly_mmap(file_path)
+            if mapped is not None:
+                with mapped:
+                    return hashlib.new('sha256', mapped).hexdigest()
+
+            # Empty or unmappable file (e.g. 32-bit build): chunked reads
+            # Python 3.11+: hash in a C loop with the GIL released per buffer
+            if hasattr(hashlib, 'file_digest'):
+                return hashlib.file_digest(f, 'sha256').hexdigest()
+
+            sha256_hash = hashlib.new('sha256')
+            for byte_block in iter(lambda: f.read(CHECKSUM_CHUNK_SIZE), b""):
+                sha256_hash.update(byte_block)
+            return sha256_hash.hexdigest()
+        finally:
+            _fadvise(f, 'POSIX_FADV_DONTNEED')
+
+
+def save_upload(file_storage, file_path, compute_checksum=False):
+    """
+    Write an uploaded file to disk, counting bytes as they are written.
+
+    With ``compute_checksum`` each chunk is also hashed while it is still in
+    cache on its way to disk, so the dump never has to be re-read just to
+    compute the checksum.
+
+    Returns:
+        tuple: (file size in bytes, SHA-256 hex digest or None)
+    """
+    sha256_hash = hashlib.new('sha256') if compute_checksum else None
+    file_size = 0
+    with open(file_path, 'wb') as out:
+        while chunk := file_storage.stream.read(CHECKSUM_CHUNK_SIZE):
+            out.write(chunk)
+            file_size += len(chunk)
+            if sha256_hash:
+                sha256_hash.update(chunk)
+    return file_size, sha256_hash.hexdigest() if sha256_hash else None
+
+
+def adopt_upload(tmp_path, file_path, compute_checksum=False):
+    """
+    Move an upload that a reverse proxy already wrote to disk into place.
+
+    This is a rename on the same filesystem, so no bytes are copied. With
+    ``compute_checksum`` the file is read exactly once, for hashing.
+
+    Returns:
+        tuple: (file size in bytes, SHA-256 hex digest or None)
+    """
+    checksum = calculate_checksum(tmp_path) if compute_checksum else None
+    file_size = os.path.getsize(tmp_path)
+    os.replace(tmp_path, file_path)
+    return file_size, checksum
+
+
+def _hash_range(file_path, offset, length):
+    """Return the raw SHA-256 digest of ``length`` bytes starting at ``offset``."""
+    sha256_hash = hashlib.new('sha256')
+    with open(file_path, 'rb') as f:
+        f.seek(offset)
+        remaining = length
+        while remaining > 0:
+            byte_block = f.read(min(CHECKSUM_CHUNK_SIZE, remaining))
+            if not byte_block:
+                break
+            sha256_hash.update(byte_block)
+            remaining -= len(byte_block)
+        _fadvise(f, 'POSIX_FADV_DONTNEED', offset, length)
+    return sha256_hash.digest()
+
+
+def calculate_tree_checksum(file_path, part_size=TREE_PART_SIZE, max_workers=None):
+    """
+    Calculate a Merkle-style SHA-256 checksum of a file across several cores.
+
+    Each ``part_size`` range is hashed in its own thread (hashlib releases
+    the GIL while hashing large buffers), then the part digests are hashed
+    together in order. The result is not a plain SHA-256 of the file, so it
+    is stored alongside ``TREE_CHECKSUM_ALGO``.
+    """
+    file_size = os.path.getsize(file_path)
+    offsets = range(0, max(file_size, 1), part_size)
+
+    with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        part_digests = executor.map(
+            lambda offset: _hash_range(file_path, offset, part_size), offsets
+        )
+        return hashlib.new('sha256', b"".join(part_digests)).hexdigest()
@@ -49,6 +49,57 @@ def _emit_case_update(socketio, case_id: int, status: str, message: str):
         print(f"[TASK] Notification creation failed (non-critical): {e}")
 
 
+def ingest_memory_dump(case_id: int):
+    """
+    Fill in the checksum of an uploaded dump.
+
+    Hashing a multi-GB dump is kept out of the upload request so the HTTP
+    worker can return as soon as the file is on disk.
+
+    Args:
+        case_id: The ID of the case whose file should be checksummed
+
+    Returns:
+        dict: Checksum summary
+    """
+    from app import create_app
+    from app.extensions import db
+    from app.models.casefile import CaseFile
+    from app.services.file_service import calculate_tree_checksum, TREE_CHECKSUM_ALGO
+    from app.services.case_cache import invalidate_case
+    from sqlalchemy import select, update
+
+    app = create_app()
+
+    with app.app_context():
+        row = db.session.execute(
+            select(CaseFile.id, CaseFile.file_path).where(CaseFile.case_id == case_id)
+        ).first()
+        if not row:
+            raise ValueError(f"No file found for case {case_id}")
+        case_file_id, dump_path = row
+
+        print(f"[TASK] Calculating {TREE_CHECKSUM_ALGO} checksum for case {case_id}...")
+        checksum = calculate_tree_checksum(dump_path)
+
+        # Update CaseFile with real checksum
+        db.session.execute(
+            update(CaseFile)
+            .where(CaseFile.id == case_file_id)
+            .values(checksum=checksum, checksum_algo=TREE_CHECKSUM_ALGO)
+        )
+        db.session.commit()
+        invalidate_case(case_id)
+        print(f"[TASK] Checksum: {checksum}")
+
+    return {
+        "status": "success",
+        "case_id": case_id,
+        "checksum": checksum,
+        "checksum_algo": TREE_CHECKSUM_ALGO
+    }
+
+
 def analyze_memory_dump(case_id: int):
     """
     Analyze a memory dump file for a given case using Volatility3 via MemflowAnalyzer.
@@ -67,6 +118,7 @@ def analyze_memory_dump(case_id: int):
     from app.extensions import db
     from app.models.case import Case
     from app.models.casefile import CaseFile
+    from app.services.case_cache import invalidate_case
 
     # Add cli_tool directory to path for MemflowAnalyzer import
     cli_tool_path = os.path.join(
@@ -111,26 +163,11 @@ def analyze_memory_dump(case_id: int):
             case.status = 'processing'
             case.updated_at = datetime.utcnow()
             db.session.commit()
+            invalidate_case(case_id)
             print(f"[TASK] Case {case_id} status updated to PROCESSING")
             from app.extensions import socketio
             _emit_case_update(socketio, case_id, 'processing', f'Case {case_id} analysis started')
 
-            # ─────────────────────────────────────────────────────────────
-            # Calculate SHA256 checksum (deferred from upload for speed)
-            # ─────────────────────────────────────────────────────────────
-            import hashlib
-            print(f"[TASK] Calculating SHA256 checksum...")
-            sha256_hash = hashlib.sha256()
-            with open(dump_path, "rb") as f:
-                for byte_block in iter(lambda: f.read(65536), b""):
-                    sha256_hash.update(byte_block)
-            checksum = sha256_hash.hexdigest()
-
-            # Update CaseFile with real checksum
-            case_file.checksum = checksum
-            db.session.commit()
-            print(f"[TASK] Checksum: {checksum}")
-
             # ─────────────────────────────────────────────────────────────
             # Run Volatility3 Analysis via MemflowAnalyzer
             # ─────────────────────────────────────────────────────────────
@@ -142,11 +179,14 @@ def analyze_memory_dump(case_id: int):
 
             analyzer = MemflowAnalyzer(progress_callback=on_progress)
 
-            # Run the full analysis (standard level includes network + essential plugins)
+            # Run the full analysis (standard level includes network + essential plugins).
+            # force: uploads are already extension-checked, and a valid raw
+            # dump may have no OS signature in the sampled window
             results = analyzer.analyze(
                 dump_path=dump_path,
                 plugin_level="standard",
-                use_color=False   # Disable colors since we're in a background process
+                use_color=False,  # Disable colors since we're in a background process
+                force=True
             )
 
             print(f"✅ Volatility3 analysis completed for case {case_id}")
@@ -204,6 +244,7 @@ def analyze_memory_dump(case_id: int):
             case.case_metadata = current_meta
 
             db.session.commit()
+            invalidate_case(case_id)
             elapsed = (datetime.utcnow() - analysis_start).total_seconds()
             print(f"[TASK] Case {case_id} status updated to COMPLETED")
             print(f"⏱ Total analysis time: {elapsed:.1f}s ({elapsed/60:.1f} min)")
@@ -238,6 +279,7 @@ def analyze_memory_dump(case_id: int):
                     case.status = 'failed'
                     case.updated_at = datetime.utcnow()
                     db.session.commit()
+                    invalidate_case(case_id)
                     _emit_case_update(socketio, case_id, 'failed',
                                       f'Case {case_id} analysis failed: {str(e)[:80]}')
             except Exception as db_error:
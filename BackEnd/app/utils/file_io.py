@@ -0,0 +1,35 @@
+"""
+Read-only memory-mapping helpers for large memory dumps.
+Lets hashing/scanning code work on the page cache directly instead of
+copying every read into a fresh Python bytes buffer.
+"""
+import mmap
+import os
+import sys
+
+
+def open_readonly_mmap(path):
+    """
+    Map a file read-only and return the mmap, or None if it can't be mapped.
+
+    The mapping is advised as sequential (MADV_SEQUENTIAL, where supported)
+    so the kernel reads ahead aggressively and drops pages behind the
+    reader. Pages are faulted in as they are read, not up front: populating
+    a multi-GB dump at map time would read the whole file before returning
+    and push the rest of the worker's working set out of the page cache.
+    Empty files and files larger than the address space (32-bit builds)
+    return None so callers can fall back to chunked reads. The mapping
+    stays valid after the file is closed; close it (or use ``with``) when done.
+    """
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0 or size > sys.maxsize:
+            return None
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError, OverflowError):
+            # e.g. not enough contiguous address space for the whole file
+            return None
+    if hasattr(mapped, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+        mapped.madvise(mmap.MADV_SEQUENTIAL)
+    return mapped
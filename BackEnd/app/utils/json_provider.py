@@ -0,0 +1,19 @@
+"""
+orjson-backed JSON provider for Flask.
+Serializes API responses in C; datetimes are emitted as ISO 8601 natively.
+"""
+import orjson
+from flask.json.provider import JSONProvider
+
+
+class ORJSONProvider(JSONProvider):
+    """Flask JSON provider using orjson for dumps/loads (used by jsonify)."""
+
+    option = orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj, **kwargs):
+        # Fall back to str() for anything orjson cannot serialize natively
+        return orjson.dumps(obj, default=str, option=self.option).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
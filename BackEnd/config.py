@@ -15,21 +15,52 @@ class Config:
     # Disable tracking (improves performance)
     SQLALCHEMY_TRACK_MODIFICATIONS = False
 
+    # Connection pool sizing — pool_size should roughly match
+    # (gunicorn workers * threads); pre-ping drops connections Postgres closed
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        "pool_size": int(os.getenv("DB_POOL_SIZE", 20)),
+        "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", 40)),
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,   # Recycle connections every 30 minutes
+        "pool_timeout": 10,     # Seconds to wait for a free connection
+        # psycopg2 fast execution helpers for multi-row UPDATE; multi-row
+        # INSERTs are already batched by SQLAlchemy 2.x "insertmanyvalues"
+        "executemany_mode": "values_plus_batch",
+    }
+
     # Where uploaded memory dumps will be stored
     UPLOAD_DIR = os.getenv("UPLOAD_DIR", "data/cases")
 
+    # Directory where a fronting proxy spools upload bodies (e.g. nginx
+    # upload_store). When set, uploads whose file part was already written
+    # there are passed as X-Upload-Tmp-Path / X-Upload-Filename headers and
+    # renamed into UPLOAD_DIR instead of being copied. Must be on the same
+    # filesystem as UPLOAD_DIR, and the proxy must strip client-sent X-Upload-* headers.
+    UPLOAD_INCOMING_DIR = os.getenv("UPLOAD_INCOMING_DIR")
+
     # Max upload size (8GB)
     MAX_CONTENT_LENGTH = 8 * 1024 * 1024 * 1024  # 8 GB
 
+    # Hash uploads inside the request instead of in the ingest worker task.
+    # Off by default so upload latency does not scale with dump size.
+    CHECKSUM_ON_UPLOAD = os.getenv("CHECKSUM_ON_UPLOAD", "false").lower() == "true"
+
     # Flask environment (development by default)
     FLASK_ENV = os.getenv("FLASK_ENV", "development")
 
     # Redis configuration for job queue
     REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6382/0")
+    REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", 64))
     
-    # RQ Queue name for forensics analysis
+    # Seconds a serialized case stays in the Redis read-through cache
+    CASE_CACHE_TTL = int(os.getenv("CASE_CACHE_TTL", 60))
+
+    # RQ Queue name for forensics analysis (few long, memory-heavy jobs)
     RQ_QUEUE_NAME = os.getenv("RQ_QUEUE_NAME", "forensics_analysis")
 
+    # RQ Queue name for ingest/checksum jobs (short, CPU/IO-bound jobs)
+    RQ_INGEST_QUEUE_NAME = os.getenv("RQ_INGEST_QUEUE_NAME", "forensics_ingest")
+
     # ── JWT Authentication ──────────────────────────────────────────────────
     JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY", "memflow-change-this-secret-in-production")
     JWT_ACCESS_TOKEN_EXPIRES = timedelta(hours=1)    # Short-lived access token
@@ -0,0 +1,26 @@
+"""Add checksum_algo to case_files
+
+Revision ID: 4f2c9a7d1e31
+Revises: bb60f1a85233
+Create Date: 2026-10-14 09:12:40.218354
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4f2c9a7d1e31'
+down_revision = 'bb60f1a85233'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('case_files', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('checksum_algo', sa.String(length=32), nullable=False, server_default='sha256'))
+
+
+def downgrade():
+    with op.batch_alter_table('case_files', schema=None) as batch_op:
+        batch_op.drop_column('checksum_algo')
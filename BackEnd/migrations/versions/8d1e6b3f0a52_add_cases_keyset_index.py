@@ -0,0 +1,26 @@
+"""Add composite index for keyset pagination on cases
+
+Revision ID: 8d1e6b3f0a52
+Revises: 4f2c9a7d1e31
+Create Date: 2026-10-14 10:03:17.541902
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8d1e6b3f0a52'
+down_revision = '4f2c9a7d1e31'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('cases', schema=None) as batch_op:
+        batch_op.create_index('ix_cases_created_id', [sa.text('created_at DESC'), sa.text('id DESC')], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('cases', schema=None) as batch_op:
+        batch_op.drop_index('ix_cases_created_id')
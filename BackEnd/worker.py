@@ -5,18 +5,22 @@ This script starts a worker that listens to the Redis queue
 and processes jobs asynchronously.
 
 WINDOWS COMPATIBILITY:
-This worker uses burst mode with timeout to properly handle Ctrl+C on Windows.
-The worker checks for shutdown signals between job bursts.
+The worker blocks on Redis (BLPOP) until a job arrives instead of polling.
+RQ's own signal setup is skipped; our Ctrl+C handler asks the worker to
+stop, so it finishes the current job (or wakes from the blocking dequeue)
+and exits. A second Ctrl+C forces an immediate cold shutdown.
 
 Usage:
-    python worker.py
+    python worker.py                      # listen on ingest + analysis queues
+    python worker.py forensics_analysis   # dedicated pool for one queue
+
+Run separate worker processes per queue to scale ingest (short checksum
+jobs) and analysis (long Volatility runs) independently.
 """
 import sys
 import signal
-import time
 import logging
 from rq import SimpleWorker, Queue
-from rq.worker import StopRequested
 from app.extensions.redis_client import redis_conn
 from config import Config
 
@@ -26,19 +30,43 @@ logging.basicConfig(
     format='%(message)s'
 )
 
-# Global flag for graceful shutdown
-shutdown_requested = False
+# Worker instance, set in main() so the signal handler can stop it
+worker = None
+
+
+class MemflowWorker(SimpleWorker):
+    """SimpleWorker whose shutdown signals are wired up by this script."""
+
+    # Seconds each blocking dequeue (BLPOP) waits before the worker renews
+    # its heartbeat. Bounds shutdown latency on Windows, where Ctrl+C can't
+    # interrupt a blocked socket read.
+    dequeue_timeout = 30
+
+    # Seconds between polls of the pub-sub thread (RQ default 0.2s). It only
+    # carries rare control commands such as stop/kill-horse, so polling 10x
+    # less often costs nothing noticeable; shutdown is signal-driven.
+    pubsub_sleep_time = 2.0
+
+    def _install_signal_handlers(self):
+        # main() installs signal_handler instead of RQ's defaults
+        pass
+
+    def subscribe(self):
+        """Subscribe to this worker's command channel with a slower poll."""
+        self.log.info('Subscribing to channel %s', self.pubsub_channel_name)
+        self.pubsub = self.connection.pubsub()
+        self.pubsub.subscribe(**{self.pubsub_channel_name: self.handle_payload})
+        self.pubsub_thread = self.pubsub.run_in_thread(
+            sleep_time=self.pubsub_sleep_time, daemon=True
+        )
+
 
 def signal_handler(signum, frame):
     """Handle Ctrl+C gracefully"""
-    global shutdown_requested
-    if shutdown_requested:
-        # Second Ctrl+C - force quit
-        print("\n⚠ Force quitting...")
-        sys.exit(0)
-    
-    shutdown_requested = True
     print("\n⚠ Shutdown requested... Finishing current job (Ctrl+C again to force quit)")
+    # Warm shutdown: raises StopRequested when idle, or stops after the
+    # current job. RQ rebinds SIGINT so a second Ctrl+C is a cold shutdown.
+    worker.request_stop(signum, frame)
 
 def job_started(job, *args, **kwargs):
     """Callback when a job starts"""
@@ -56,45 +84,35 @@ def main():
         print("  Make sure Redis server is running on localhost:6382")
         sys.exit(1)
     
-    # Register signal handler for graceful shutdown
-    signal.signal(signal.SIGINT, signal_handler)
-    
     print("=" * 70)
     print("RQ Worker - Memory Forensics Analysis")
     print("=" * 70)
-    print(f"Queue: {Config.RQ_QUEUE_NAME}")
+    # Queues to listen on, in priority order (default: ingest first, then analysis)
+    queue_names = sys.argv[1:] or [Config.RQ_INGEST_QUEUE_NAME, Config.RQ_QUEUE_NAME]
+    
+    print(f"Queues: {', '.join(queue_names)}")
     print(f"Redis: {Config.REDIS_URL}")
     print("=" * 70)
     
     # Create queue and worker
-    queue = Queue(Config.RQ_QUEUE_NAME, connection=redis_conn)
-    worker = SimpleWorker([queue], connection=redis_conn)
-
+    global worker
+    queues = [Queue(name, connection=redis_conn) for name in queue_names]
+    worker = MemflowWorker(queues, connection=redis_conn)
+    
+    # Register signal handlers for graceful shutdown
+    signal.signal(signal.SIGINT, signal_handler)
+    signal.signal(signal.SIGTERM, signal_handler)
     
     # Register job lifecycle callbacks
     worker.push_exc_handler(lambda job, *exc_info: print(f"❌ Job {job.id} failed"))
     
-    print(f"\n✓ Worker started - Listening on queue: {Config.RQ_QUEUE_NAME}")
+    print(f"\n✓ Worker started - Listening on queues: {', '.join(queue_names)}")
     print("  Press Ctrl+C to stop\n")
     
-    # Work loop with periodic shutdown checks (Windows-compatible)
+    # Single blocking work loop: jobs are picked up as soon as they are
+    # pushed, with no polling interval or idle wake-ups
     try:
-        while not shutdown_requested:
-            try:
-                # Process jobs in burst mode with timeout
-                # This allows the worker to check for shutdown signals periodically
-                worker.work(burst=True, max_jobs=1, with_scheduler=False, logging_level='WARNING')
-                
-                # Small sleep to prevent CPU spinning when queue is empty
-                if not shutdown_requested:
-                    time.sleep(1)  # Check for new jobs every second
-                    
-            except StopRequested:
-                # RQ's internal shutdown signal - this is expected
-                break
-                
-    except KeyboardInterrupt:
-        pass  # Handled by signal handler
+        worker.work(burst=False, with_scheduler=False, logging_level='WARNING')
     finally:
         print("✓ Worker stopped gracefully\n")
 
@@ -5,30 +5,55 @@ Analyzes memory dumps with support for multiple formats and operating systems.
 Designed for both CLI usage and background integration.
 """
 import argparse
+import functools
 import hashlib
+import importlib.metadata
 import json
+import mmap
 import os
 import platform
 import subprocess
 import shutil
 import sys
 import re
-import struct
+import shlex
 import threading
 import time
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any, Callable
+from typing import Dict, List, Optional, Tuple, Any, Callable, Iterable, Iterator, Union
 from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from enum import Enum
+from itertools import islice
+
+try:
+    import ahocorasick  # Optional: single-pass multi-pattern signature scan
+except ImportError:
+    ahocorasick = None
+
+try:
+    import blake3  # Optional: multithreaded SIMD digest for --blake3
+except ImportError:
+    blake3 = None
+
+try:
+    import orjson  # Optional: fast serializer for --json reports
+except ImportError:
+    orjson = None
 
 # Constants
-BUFFER_SIZE = 65536
+_PLATFORM = platform.system().lower()  # e.g. "windows", "linux", "darwin"
+BUFFER_SIZE = 4 << 20  # 4MB hashing chunks
+# How far (in bytes) the fastest legacy digest may run ahead of the slowest,
+# so the trailing threads still find the shared pages in the page cache
+HASH_MAX_DRIFT = 64 * BUFFER_SIZE
 HEURISTIC_SAMPLE_SIZE = 4_000_000  # Increased to 4MB for better detection
+HEURISTIC_WINDOW_SIZE = 64 << 10  # OS signature scan step; stops once the rest cannot change the result
 DEFAULT_TIMEOUT = 300  # 5 minutes for volatility commands
 MIN_FILE_SIZE = 1024  # 1KB minimum for memory dumps
-MAX_WORKERS = 4  # Parallel plugin execution
+PROGRESS_REDRAW_INTERVAL = 0.1  # Seconds between CLI progress line redraws
+MAX_WORKERS = 4  # Parallel plugin execution fallback when the CPU count is unknown
 DEFAULT_TERMINAL_WIDTH = 100  # Fallback if terminal width can't be detected
 
 # ANSI Color Codes
@@ -77,6 +102,20 @@ FORMAT_SIGNATURES = {
     ],
 }
 
+# FORMAT_SIGNATURES flattened to (format name, signature) in check order
+_FORMAT_SIGNATURE_TABLE = tuple(
+    (format_name, sig)
+    for format_name, signatures in FORMAT_SIGNATURES.items()
+    for sig in signatures
+)
+
+# Table positions keyed by each signature's first 4 bytes, for the common
+# case of a magic at offset 0 (every signature is at least 4 bytes long)
+_FORMAT_MAGIC_MAP: Dict[bytes, List[int]] = {}
+for _index, (_format_name, _sig) in enumerate(_FORMAT_SIGNATURE_TABLE):
+    _FORMAT_MAGIC_MAP.setdefault(_sig[:4], []).append(_index)
+del _index, _format_name, _sig
+
 # OS Detection signatures (expanded)
 WINDOWS_SIGNATURES = [
     b"SystemRoot",
@@ -106,6 +145,14 @@ MAC_SIGNATURES = [
     b"Mach-O",
 ]
 
+ALL_OS_SIGNATURES = WINDOWS_SIGNATURES + LINUX_SIGNATURES + MAC_SIGNATURES
+_MAX_SIGNATURE_LEN = max(map(len, ALL_OS_SIGNATURES))
+
+# Confidence is min(100, 50 + score), so any score past this is already 100%
+SATURATED_SIGNATURE_SCORE = 50
+# Heuristic confidence given to an OS named with --assume-os
+ASSUMED_OS_CONFIDENCE = 70
+
 # Comprehensive plugin lists
 WINDOWS_PLUGINS = {
     'essential': [
@@ -167,6 +214,11 @@ MACOS_PLUGINS = {
     ]
 }
 
+# Connection-listing plugins across all OSes, for the "network failed" check
+NETWORK_PLUGINS = frozenset(
+    WINDOWS_PLUGINS['network'] + LINUX_PLUGINS['network'] + MACOS_PLUGINS['network']
+)
+
 
 class DumpFormat(Enum):
     """Supported memory dump formats"""
@@ -188,7 +240,7 @@ class OSType(Enum):
     UNKNOWN = "Unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisProgress:
     """Progress tracking for background integration"""
     stage: str
@@ -289,28 +341,37 @@ def detect_dump_format(path: str, progress: Optional[ProgressTracker] = None) ->
     if progress:
         progress.update("Format Detection", 0, 3, "Reading file header")
     
-    size_bytes = os.path.getsize(path)
-    
     try:
         with open(path, "rb") as f:
-            # Read first 512 bytes for magic byte detection
-            header = f.read(512)
+            # Size from the open descriptor: no separate stat() by path
+            size_bytes = os.fstat(f.fileno()).st_size
+            # Signatures and compression magics all sit in the first 64 bytes
+            header = f.read(64)
             
             if progress:
                 progress.update("Format Detection", 1, 3, "Analyzing signatures")
             
-            # Check for specific format signatures
-            for format_name, signatures in FORMAT_SIGNATURES.items():
-                for sig in signatures:
-                    if sig in header[:64]:
-                        format_type = _map_format_name(format_name)
-                        return FormatInfo(
-                            format_type=format_type,
-                            confidence=90,
-                            evidence=[f"Found {format_name} signature: {sig[:8]}"],
-                            size_bytes=size_bytes,
-                            is_compressed=False
-                        )
+            # Check for specific format signatures: the first table entry
+            # found anywhere in the header wins, so overlapping signatures
+            # resolve in table order. A magic at offset 0 (one dict lookup)
+            # bounds the sweep: only entries ahead of it in the table can
+            # still win, so the later ones are skipped.
+            # (Too short for a multi-pattern scan to pay off.)
+            end = next(
+                (index + 1 for index in _FORMAT_MAGIC_MAP.get(header[:4], ())
+                 if header.startswith(_FORMAT_SIGNATURE_TABLE[index][1])),
+                len(_FORMAT_SIGNATURE_TABLE)
+            )
+            for format_name, sig in _FORMAT_SIGNATURE_TABLE[:end]:
+                if sig in header:
+                    format_type = _map_format_name(format_name)
+                    return FormatInfo(
+                        format_type=format_type,
+                        confidence=90,
+                        evidence=[f"Found {format_name} signature: {sig[:8]}"],
+                        size_bytes=size_bytes,
+                        is_compressed=False
+                    )
             
             if progress:
                 progress.update("Format Detection", 2, 3, "Checking compression")
@@ -347,21 +408,33 @@ def _map_format_name(format_name: str) -> DumpFormat:
     return mapping.get(format_name, DumpFormat.UNKNOWN)
 
 
+# Leading magic bytes of compressed containers
+_COMPRESSION_PREFIXES = (
+    b'\x1f\x8b',  # gzip
+    b'BZ',        # bzip2
+    b'\x50\x4b',  # zip
+    b'\xfd\x37',  # xz
+)
+
+
 def _check_compression(header: bytes) -> bool:
     """Check if file appears to be compressed"""
-    compression_signatures = [
-        b'\x1f\x8b',  # gzip
-        b'BZ',        # bzip2
-        b'\x50\x4b',  # zip
-        b'\xfd\x37',  # xz
-    ]
-    return any(header.startswith(sig) for sig in compression_signatures)
+    return header.startswith(_COMPRESSION_PREFIXES)
 
 
 # ---------------------------------------------------------
 # Enhanced OS Detection
 # ---------------------------------------------------------
 
+# Signature list of each OS family; scoring, early exit and evidence all
+# read the one set of scan hits through this table
+OS_FAMILY_SIGNATURES = {
+    OSType.WINDOWS: WINDOWS_SIGNATURES,
+    OSType.LINUX: LINUX_SIGNATURES,
+    OSType.MACOS: MAC_SIGNATURES,
+}
+
+
 def enhanced_os_detection(path: str, progress: Optional[ProgressTracker] = None) -> Tuple[OSType, List[str], int]:
     """
     Multi-stage OS detection with improved accuracy.
@@ -379,29 +452,30 @@ def enhanced_os_detection(path: str, progress: Optional[ProgressTracker] = None)
     try:
         with open(path, "rb") as f:
             # Read larger sample for better detection
-            sample = f.read(HEURISTIC_SAMPLE_SIZE)
+            sample_len = min(HEURISTIC_SAMPLE_SIZE, os.fstat(f.fileno()).st_size)
+            hits = {}
+            if sample_len:
+                # Scan the mapped sample straight from the page cache
+                # instead of copying it into a bytes object first
+                with mmap.mmap(f.fileno(), sample_len, access=mmap.ACCESS_READ) as sample:
+                    # Windows are scanned front to back
+                    if hasattr(mmap, "MADV_SEQUENTIAL"):
+                        sample.madvise(mmap.MADV_SEQUENTIAL)
+                    hits = _scan_signatures(sample, sample_len)
         
         # Count signature occurrences with position weighting
-        windows_score = _calculate_signature_score(sample, WINDOWS_SIGNATURES)
-        linux_score = _calculate_signature_score(sample, LINUX_SIGNATURES)
-        mac_score = _calculate_signature_score(sample, MAC_SIGNATURES)
+        scores = _family_scores(hits, sample_len)
         
         if progress:
             progress.update("OS Detection", 1, 2, "Analyzing kernel structures")
         
         # Determine OS with confidence
-        scores = {
-            OSType.WINDOWS: windows_score,
-            OSType.LINUX: linux_score,
-            OSType.MACOS: mac_score,
-        }
-        
         detected_os = max(scores, key=scores.get)
         max_score = scores[detected_os]
         
         if max_score > 0:
             confidence = min(100, 50 + max_score)
-            evidence = _generate_evidence(detected_os, sample)
+            evidence = _generate_evidence(detected_os, hits)
             
             if progress:
                 progress.update("OS Detection", 2, 2, f"Detected {detected_os.value}")
@@ -417,16 +491,142 @@ def enhanced_os_detection(path: str, progress: Optional[ProgressTracker] = None)
         return (OSType.UNKNOWN, [f"Error during OS detection: {e}"], 0)
 
 
-def _calculate_signature_score(sample: bytes, signatures: List[bytes]) -> int:
+def _build_signature_automaton() -> Optional[Any]:
+    """Compile all OS signatures into one Aho-Corasick automaton, if available"""
+    if ahocorasick is None:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for sig in ALL_OS_SIGNATURES:
+        # latin-1 maps each byte to one code point, so byte signatures
+        # work with the default (str-keyed) pyahocorasick build
+        automaton.add_word(sig.decode('latin-1'), sig)
+    automaton.make_automaton()
+    return automaton
+
+
+_SIGNATURE_AUTOMATON = _build_signature_automaton()
+
+
+def _scan_signatures(sample: Any, sample_len: int) -> Dict[bytes, Tuple[int, int]]:
+    """
+    Find OS signatures in a sample (bytes or mmap).
+    
+    The sample is walked in HEURISTIC_WINDOW_SIZE steps and the scan stops
+    as soon as the result is decisive (see _is_decisive): the same family
+    is detected as by a full scan, with saturated confidence. Matches spanning a window boundary are still found.
+    
+    Returns:
+        Mapping of each signature found to (occurrence count, first offset)
+    """
+    hits = {}
+    # Offset at which each signature's next match may start. Matches are
+    # counted non-overlapping (like bytes.count) on both scanners, so a
+    # self-overlapping signature such as b"/etc/" scores the same with or
+    # without pyahocorasick.
+    resume = dict.fromkeys(ALL_OS_SIGNATURES, 0)
+    
+    for start in range(0, sample_len, HEURISTIC_WINDOW_SIZE):
+        end = min(start + HEURISTIC_WINDOW_SIZE, sample_len)
+        
+        if _SIGNATURE_AUTOMATON is not None:
+            # Extend the window so matches starting inside it are complete
+            window = str(sample[start:end + _MAX_SIGNATURE_LEN - 1], 'latin-1')
+            # One pass over the window matches every signature at once
+            for last, sig in _SIGNATURE_AUTOMATON.iter(window):
+                pos = start + last - len(sig) + 1
+                if pos >= end:
+                    continue  # Belongs to the next window
+                if pos < resume[sig]:
+                    continue  # Overlaps the previous counted match
+                count, first = hits.get(sig, (0, pos))
+                hits[sig] = (count + 1, first)
+                resume[sig] = pos + len(sig)
+        else:
+            # mmap has find() but no count(), so count non-overlapping matches by hand.
+            # find() is CPython's C fast search (memchr-driven), already quicker
+            # than building per-byte comparison masks over the window.
+            for sig in ALL_OS_SIGNATURES:
+                limit = min(end + len(sig) - 1, sample_len)
+                pos = sample.find(sig, resume[sig], limit)
+                while pos != -1:
+                    count, first = hits.get(sig, (0, pos))
+                    hits[sig] = (count + 1, first)
+                    resume[sig] = pos + len(sig)
+                    pos = sample.find(sig, resume[sig], limit)
+                resume[sig] = max(resume[sig], end)
+        
+        if _is_decisive(hits, sample_len, sample_len - end):
+            break
+    
+    return hits
+
+
+def _is_decisive(hits: Dict[bytes, Tuple[int, int]], sample_len: int, remaining: int) -> bool:
+    """
+    True once scanning the last ``remaining`` bytes can't change the result.
+    
+    The leading family's score must saturate the confidence, and every
+    other family must stay strictly below it even if the unscanned bytes
+    held as many of its signatures as could fit there. Ties are never
+    settled by scan order.
+    """
+    scores = _family_scores(hits, sample_len)
+    leader = max(scores, key=scores.get)
+    top = scores[leader]
+    if top < SATURATED_SIGNATURE_SCORE:
+        return False
+    return all(
+        score + _max_score_gain(os_type, remaining) < top
+        for os_type, score in scores.items() if os_type is not leader
+    )
+
+
+def _signature_period(sig: bytes) -> int:
+    """Smallest shift at which a signature overlaps itself (its length if never)"""
+    for shift in range(1, len(sig)):
+        if sig[shift:] == sig[:-shift]:
+            return shift
+    return len(sig)
+
+
+# (length, period) of each family's signatures, for bounding future hits
+_FAMILY_SIGNATURE_SHAPES = {
+    os_type: [(len(sig), _signature_period(sig)) for sig in sigs]
+    for os_type, sigs in OS_FAMILY_SIGNATURES.items()
+}
+
+
+def _max_score_gain(os_type: OSType, remaining: int) -> int:
+    """
+    Upper bound on how much a family's score can still grow from matches
+    starting in the last ``remaining`` bytes (each hit adds at most 10).
+    """
+    gain = 0
+    for length, period in _FAMILY_SIGNATURE_SHAPES[os_type]:
+        # Matches starting in scanned windows are already counted, even
+        # when they run past the window's end
+        if remaining >= length:
+            gain += ((remaining - length) // period + 1) * 10
+    return gain
+
+
+def _family_scores(hits: Dict[bytes, Tuple[int, int]], sample_len: int) -> Dict[OSType, int]:
+    """Score every OS family from one set of scan hits"""
+    return {
+        os_type: _calculate_signature_score(hits, sample_len, sigs)
+        for os_type, sigs in OS_FAMILY_SIGNATURES.items()
+    }
+
+
+def _calculate_signature_score(hits: Dict[bytes, Tuple[int, int]], sample_len: int,
+                               signatures: List[bytes]) -> int:
     """Calculate weighted score based on signature occurrences and positions"""
     score = 0
-    sample_len = len(sample)
     
     for sig in signatures:
-        count = sample.count(sig)
-        if count > 0:
-            # Find first occurrence position
-            pos = sample.find(sig)
+        if sig in hits:
+            count, pos = hits[sig]
             # Earlier occurrences get higher weight
             position_weight = 1.0 if pos < sample_len // 4 else 0.5
             score += count * 10 * position_weight
@@ -434,23 +634,16 @@ def _calculate_signature_score(sample: bytes, signatures: List[bytes]) -> int:
     return int(score)
 
 
-def _generate_evidence(os_type: OSType, sample: bytes) -> List[str]:
+def _generate_evidence(os_type: OSType, hits: Dict[bytes, Tuple[int, int]]) -> List[str]:
     """Generate evidence list for detected OS"""
     evidence = []
     
-    if os_type == OSType.WINDOWS:
-        sigs = WINDOWS_SIGNATURES
-        os_name = "Windows"
-    elif os_type == OSType.LINUX:
-        sigs = LINUX_SIGNATURES
-        os_name = "Linux"
-    elif os_type == OSType.MACOS:
-        sigs = MAC_SIGNATURES
-        os_name = "macOS"
-    else:
+    sigs = OS_FAMILY_SIGNATURES.get(os_type)
+    if sigs is None:
         return ["Unknown OS"]
+    os_name = os_type.value
     
-    found_sigs = [sig for sig in sigs if sig in sample]
+    found_sigs = [sig for sig in sigs if sig in hits]
     if found_sigs:
         evidence.append(f"Found {len(found_sigs)} {os_name} kernel signature(s)")
         # Add specific signatures found (without nested indentation)
@@ -468,10 +661,14 @@ def _generate_evidence(os_type: OSType, sample: bytes) -> List[str]:
 # Utility Functions
 # ---------------------------------------------------------
 
+@functools.lru_cache(maxsize=1)
 def supports_color() -> bool:
     """
     Check if the terminal supports color output.
     
+    The result is cached: TTY status and NO_COLOR don't change mid-run,
+    and on Windows the console mode only needs to be switched once.
+    
     Returns:
         True if colors are supported, False otherwise
     """
@@ -484,7 +681,7 @@ def supports_color() -> bool:
         return False
     
     # Windows 10+ supports ANSI colors
-    if platform.system() == 'Windows':
+    if _PLATFORM == 'windows':
         try:
             # Enable ANSI escape sequences on Windows
             import ctypes
@@ -510,7 +707,7 @@ def colorize(text: str, color: str, use_color: bool = True) -> str:
     Returns:
         Colorized text or plain text if colors disabled
     """
-    if not use_color:
+    if not use_color or not text:
         return text
     return f"{color}{text}{ColorCode.RESET}"
 
@@ -561,28 +758,36 @@ def get_terminal_width() -> int:
 # Volatility3 Detection (Enhanced)
 # ---------------------------------------------------------
 
-def find_volatility() -> Optional[str]:
+# Directory names never worth descending into when searching for vol.exe
+_VOL_SEARCH_SKIP_DIRS = {"__pycache__", "Lib", "site-packages", "include", "libs", "tcl", "Doc"}
+# Deepest directory level below each base path the fallback walk descends to
+_VOL_SEARCH_MAX_DEPTH = 3
+
+
+@functools.lru_cache(maxsize=1)
+def find_volatility() -> Optional[List[str]]:
     """
     Locate Volatility3 installation across different operating systems.
     
+    The result is cached, so repeated run_vol() calls don't repeat the
+    PATH probes and directory searches.
+    
     Returns:
-        Path to Volatility3 executable or command, None if not found
+        Command prefix (argv list) that runs Volatility3, None if not found
     """
-    system = platform.system().lower()
-
-    if system == "windows":
+    if _PLATFORM == "windows":
         return _find_volatility_windows()
     else:
         return _find_volatility_unix()
 
 
-def _find_volatility_windows() -> Optional[str]:
+def _find_volatility_windows() -> Optional[List[str]]:
     """Find Volatility on Windows systems"""
     # Check PATH first
     for name in ["vol.exe", "vol.cmd", "vol.bat", "vol3.exe"]:
         path = shutil.which(name)
         if path:
-            return path
+            return [path]
 
     # Check common installation directories
     possible_paths = [
@@ -593,22 +798,39 @@ def _find_volatility_windows() -> Optional[str]:
         Path.home() / "volatility3",
     ]
 
-    for base_path in possible_paths:
-        if base_path.exists():
-            for pattern in ["**/vol.exe", "**/vol.cmd", "**/vol3.exe"]:
-                for candidate in base_path.glob(pattern):
-                    if candidate.exists():
-                        return str(candidate)
+    names = ["vol.exe", "vol.cmd", "vol3.exe"]
+    base_paths = [base_path for base_path in possible_paths if base_path.is_dir()]
+
+    # Known layouts first: <base>/vol.exe and <base>/Python3*/Scripts/vol.exe
+    for base_path in base_paths:
+        script_dirs = [base_path] + [d / "Scripts" for d in base_path.glob("Python3*")]
+        for script_dir in script_dirs:
+            for name in names:
+                candidate = script_dir / name
+                if candidate.is_file():
+                    return [str(candidate)]
+
+    # Fall back to a bounded walk that stops at the first match
+    for base_path in base_paths:
+        base_depth = str(base_path).rstrip(os.sep).count(os.sep)
+        for root, dirs, files in os.walk(base_path):
+            if root.count(os.sep) - base_depth >= _VOL_SEARCH_MAX_DEPTH:
+                dirs[:] = []
+            else:
+                dirs[:] = [d for d in dirs if d not in _VOL_SEARCH_SKIP_DIRS]
+            for name in names:
+                if name in files:
+                    return [os.path.join(root, name)]
 
     return _try_python_module()
 
 
-def _find_volatility_unix() -> Optional[str]:
+def _find_volatility_unix() -> Optional[List[str]]:
     """Find Volatility on Linux/macOS systems"""
     for name in ["vol", "vol.py", "volatility3", "vol3"]:
         path = shutil.which(name)
         if path:
-            return path
+            return [path]
 
     # Check common installation paths
     possible_paths = [
@@ -619,26 +841,193 @@ def _find_volatility_unix() -> Optional[str]:
     
     for path in possible_paths:
         if path.exists():
-            return str(path)
+            # A checked-out vol.py may lack the executable bit
+            if path.suffix == ".py":
+                return [sys.executable, str(path)]
+            return [str(path)]
 
     return _try_python_module()
 
 
-def _try_python_module() -> Optional[str]:
+def _try_python_module() -> Optional[List[str]]:
     """Try to use Volatility3 as a Python module"""
     try:
         __import__("volatility3")
-        return f'"{sys.executable}" -m volatility3'
+        # Same entry point as the `vol` console script (the package has no
+        # __main__); vol scans all of sys.argv, so argv[0] must not be "-c"
+        return [sys.executable, "-c",
+                "import sys; sys.argv[0] = 'vol'; from volatility3.cli import main; main()"]
+    except ImportError:
+        return None
+
+
+# ---------------------------------------------------------
+# In-Process Volatility3 Execution
+# ---------------------------------------------------------
+
+class InProcessVolatility:
+    """
+    Run Volatility3 plugins inside this interpreter against one dump.
+    
+    The framework and its plugins are imported once and every plugin shares
+    one Context, so layers and symbol tables built for the first plugin are
+    reused instead of paying a fresh interpreter start-up per plugin.
+    Plugin runs are serialized: the framework is not thread-safe, so unlike
+    subprocess runs they don't execute in parallel. Opt-in for that reason
+    (full_analysis(in_process=True) / --in-process).
+    
+    A plugin that exceeds its timeout can't be interrupted; its thread is
+    abandoned and the session marked unusable, so callers fall back to
+    subprocess runs for the remaining plugins.
+    """
+    
+    def __init__(self, dump_path: str):
+        import volatility3.plugins
+        from volatility3 import framework
+        from volatility3.cli import MuteProgress, text_renderer
+        from volatility3.framework import automagic, contexts, plugins
+        from volatility3.framework.automagic import stacker
+        from volatility3.framework.configuration import requirements
+        
+        framework.require_interface_version(2, 0, 0)
+        framework.import_files(volatility3.plugins, True)
+        
+        self._automagic = automagic
+        self._plugins = plugins
+        self._stacker = stacker
+        self._progress = MuteProgress()
+        self._type_renderers = text_renderer.QuickTextRenderer._type_renderers
+        self._lock = threading.Lock()
+        
+        self.usable = True
+        self.plugin_list = framework.list_plugins()
+        self.context = contexts.Context()
+        self.context.config['automagic.LayerStacker.single_location'] = (
+            requirements.URIRequirement.location_from_file(os.path.abspath(dump_path))
+        )
+        self.automagics = automagic.available(self.context)
+    
+    def resolve(self, command: str) -> Optional[Any]:
+        """Map a command such as 'windows.info' to its plugin class (no extra arguments)"""
+        if ' ' in command.strip():
+            return None
+        if command in self.plugin_list:
+            return self.plugin_list[command]
+        matches = [name for name in self.plugin_list if name.startswith(command + '.')]
+        return self.plugin_list[matches[0]] if len(matches) == 1 else None
+    
+    def run(self, command: str, timeout: int = DEFAULT_TIMEOUT) -> Optional[str]:
+        """
+        Run a plugin and render its TreeGrid like the `vol` quick text renderer.
+        
+        Raises:
+            subprocess.TimeoutExpired: The plugin ran longer than ``timeout``
+                seconds; the session is no longer usable
+        """
+        plugin = self.resolve(command)
+        if plugin is None:
+            return None
+        
+        with self._lock:
+            if not self.usable:
+                raise MemflowError("In-process Volatility session was abandoned after a timeout")
+            outcome = {}
+            
+            def render() -> None:
+                try:
+                    outcome["output"] = self._render(plugin)
+                except BaseException as e:
+                    outcome["error"] = e
+            
+            # The framework call can't be cancelled, so run it on a daemon
+            # thread and stop waiting once the timeout passes
+            worker = threading.Thread(target=render, name=f"vol-{command}", daemon=True)
+            worker.start()
+            worker.join(timeout)
+            if worker.is_alive():
+                # The shared Context may be mid-update; never reuse it
+                self.usable = False
+                raise subprocess.TimeoutExpired(command, timeout)
+        
+        if "error" in outcome:
+            raise outcome["error"]
+        return outcome["output"]
+    
+    def _render(self, plugin: Any) -> str:
+        """Construct and run one plugin class, returning its rendered table"""
+        automagics = self._automagic.choose_automagic(self.automagics, plugin)
+        # Stackers depend on the plugin's OS, so pick them for each run
+        self.context.config['automagic.LayerStacker.stackers'] = (
+            self._stacker.choose_os_stackers(plugin)
+        )
+        constructed = self._plugins.construct_plugin(
+            self.context, automagics, plugin, "plugins", self._progress, None
+        )
+        grid = constructed.run()
+        
+        lines = ["\t".join(column.name for column in grid.columns)]
+        
+        def visitor(node, accumulator):
+            cells = []
+            for column, value in zip(grid.columns, node.values):
+                render = self._type_renderers.get(column.type, self._type_renderers["default"])
+                cells.append(str(render(value)))
+            depth = node.path_depth
+            prefix = "*" * max(0, depth - 1) + ("" if depth <= 1 else " ")
+            accumulator.append(prefix + "\t".join(cells))
+            return accumulator
+        
+        grid.populate(visitor, lines)
+        return "\n".join(lines) + "\n"
+    
+    def close(self) -> None:
+        """Drop the Context, its layers and symbol tables"""
+        with self._lock:
+            self.usable = False
+            self.context = None
+            self.automagics = None
+
+
+def open_in_process_volatility(dump_path: str) -> Optional[InProcessVolatility]:
+    """
+    Start an in-process Volatility3 session for a dump, or return None.
+    
+    None when volatility3 isn't importable or the framework fails to
+    initialize (e.g. an incompatible interface version); callers then run
+    `vol` as a subprocess. The caller owns the session and should close()
+    it when the analysis is done.
+    """
+    try:
+        return InProcessVolatility(dump_path)
     except ImportError:
         return None
+    except Exception as e:
+        print(f"[!] In-process Volatility unavailable, using subprocesses: {e}", file=sys.stderr)
+        return None
 
 
 # ---------------------------------------------------------
 # Volatility Command Execution (Enhanced)
 # ---------------------------------------------------------
 
+def _split_plugin_command(command: str) -> List[str]:
+    """
+    Split a plugin command line such as "--pid 4 --dump-dir 'C:/x y'" into argv.
+    
+    On Windows backslashes must stay literal (they are path separators), so
+    shlex runs in non-POSIX mode there; that mode keeps the quotes around a
+    quoted token, and they are stripped here.
+    """
+    if os.name != "nt":
+        return shlex.split(command)
+    tokens = shlex.split(command, posix=False)
+    return [token[1:-1] if len(token) >= 2 and token[0] == token[-1] and token[0] in "\"'" else token
+            for token in tokens]
+
+
 def run_vol(command: str, dump_path: str, timeout: int = DEFAULT_TIMEOUT, 
-            silent: bool = False) -> Optional[str]:
+            silent: bool = False,
+            session: Optional[InProcessVolatility] = None) -> Optional[str]:
     """
     Execute a Volatility3 command on the memory dump.
     
@@ -647,22 +1036,42 @@ def run_vol(command: str, dump_path: str, timeout: int = DEFAULT_TIMEOUT,
         dump_path: Path to the memory dump file
         timeout: Command timeout in seconds
         silent: Suppress error messages
+        session: Optional in-process session (see open_in_process_volatility);
+            used for plain plugin names while it is usable
         
     Returns:
         Command output as string, or None if failed
     """
+    if session is not None and session.usable and session.resolve(command) is not None:
+        try:
+            return session.run(command, timeout)
+        except subprocess.TimeoutExpired:
+            if not silent:
+                print(f"[!] Command timeout after {timeout}s: {command}", file=sys.stderr)
+            return None
+        except Exception as e:
+            if session.usable:
+                if not silent:
+                    # e.g. UnsatisfiedException has no message, so fall back to its name
+                    error_line = (str(e) or type(e).__name__)[:200]
+                    print(f"[!] Plugin '{command}' failed: {error_line}", file=sys.stderr)
+                return None
+            # Another plugin timed out while this one waited for the session:
+            # run this one as a subprocess instead
+    
     vol = find_volatility()
     if not vol:
         raise VolatilityNotFoundError("Volatility3 not found. Please install it first.")
 
-    full_cmd = f'{vol} -f "{dump_path}" {command}'
+    # Explicit argv: no intermediate shell process and no quoting issues
+    argv = [*vol, "-f", dump_path, *_split_plugin_command(command)]
     
     try:
         proc = subprocess.run(
-            full_cmd,
+            argv,
             capture_output=True,
             text=True,
-            shell=True,
+            shell=False,
             timeout=timeout,
             encoding='utf-8',
             errors='replace'
@@ -689,9 +1098,92 @@ def run_vol(command: str, dump_path: str, timeout: int = DEFAULT_TIMEOUT,
         return None
 
 
+# ---------------------------------------------------------
+# Plugin Output Cache
+# ---------------------------------------------------------
+
+@functools.lru_cache(maxsize=1)
+def volatility_version() -> str:
+    """
+    Identify the Volatility3 build that produces plugin output.
+    
+    The installed package version when volatility3 is importable, otherwise
+    the `vol` executable's path and modification time, so an upgrade of
+    either invalidates cached plugin output.
+    """
+    try:
+        return importlib.metadata.version("volatility3")
+    except importlib.metadata.PackageNotFoundError:
+        pass
+    vol = find_volatility()
+    if not vol:
+        return "unknown"
+    executable = vol[-1] if vol[0] == sys.executable else vol[0]
+    try:
+        return f"{executable}@{int(os.stat(executable).st_mtime)}"
+    except OSError:
+        return executable
+
+
+def analysis_cache_dir(hashes: Dict[str, str]) -> Path:
+    """
+    Directory holding cached plugin output for the dump with these hashes.
+    
+    ``$XDG_CACHE_HOME/memflow/<algorithm>/<digest>``, defaulting to
+    ``~/.cache/memflow``, keyed by the primary digest (SHA256, or BLAKE3).
+    """
+    algorithm = "blake3" if "blake3" in hashes else "sha256"
+    cache_home = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    return cache_home / "memflow" / algorithm / hashes[algorithm]
+
+
+def _cache_path(cache_dir: Path, plugin: str) -> Path:
+    """Cache file for one plugin command (arguments make it a distinct entry)"""
+    return cache_dir / (re.sub(r'[^\w.-]+', '_', plugin) + ".json")
+
+
+def load_cached_output(cache_dir: Path, plugin: str) -> Optional[str]:
+    """Return a plugin's cached output, or None if missing, unreadable or stale"""
+    try:
+        with open(_cache_path(cache_dir, plugin), "r", encoding="utf-8") as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if entry.get("plugin") != plugin or entry.get("volatility") != volatility_version():
+        return None
+    return entry.get("output")
+
+
+def store_cached_output(cache_dir: Path, plugin: str, output: str) -> None:
+    """
+    Save a plugin's output to the cache.
+    
+    Written to a temporary file and renamed into place, so an interrupted
+    run never leaves a truncated entry. Failures are ignored: the cache is
+    only an optimization.
+    """
+    path = _cache_path(cache_dir, plugin)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    entry = {"plugin": plugin, "volatility": volatility_version(), "output": output}
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
 def run_vol_parallel(plugins: List[str], dump_path: str, 
                      progress: Optional[ProgressTracker] = None,
-                     max_workers: int = MAX_WORKERS) -> Dict[str, Optional[str]]:
+                     max_workers: Optional[int] = None,
+                     cache_dir: Optional[Path] = None,
+                     on_result: Optional[Callable[[str, Optional[str]], None]] = None,
+                     session: Optional[InProcessVolatility] = None
+                     ) -> Dict[str, Optional[str]]:
     """
     Execute multiple Volatility plugins in parallel.
     
@@ -699,23 +1191,50 @@ def run_vol_parallel(plugins: List[str], dump_path: str,
         plugins: List of plugin commands
         dump_path: Path to memory dump
         progress: Optional progress tracker
-        max_workers: Maximum parallel workers
+        max_workers: Maximum parallel workers (default: one per plugin, up to
+            the CPU count, since each subprocess run is its own process)
+        cache_dir: Plugin output cache for this dump (see analysis_cache_dir);
+            cached plugins are not run again, and successful runs are stored
+        on_result: Called with (plugin, output) as each plugin finishes, in
+            the calling thread, so its output can be processed while the
+            remaining plugins still run
+        session: Optional in-process Volatility session passed to run_vol();
+            plugins it runs are serialized, the rest still run in parallel
         
     Returns:
         Dictionary mapping plugin names to their outputs and failure reasons
     """
     results = {}
     failures = {}  # Track failure reasons
+    total = len(plugins)
+    
+    if cache_dir is not None:
+        for plugin in plugins:
+            output = load_cached_output(cache_dir, plugin)
+            if output is not None:
+                results[plugin] = output
+        if progress and results:
+            progress.update("Plugin Execution", len(results), total,
+                          f"{len(results)} plugin(s) loaded from cache")
+    
+    pending = [plugin for plugin in plugins if plugin not in results]
+    
+    if max_workers is None:
+        max_workers = max(1, min(len(pending), os.cpu_count() or MAX_WORKERS))
     
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
         # Submit all plugin tasks
         future_to_plugin = {
-            executor.submit(run_vol, plugin, dump_path, DEFAULT_TIMEOUT, True): plugin
-            for plugin in plugins
+            executor.submit(run_vol, plugin, dump_path, DEFAULT_TIMEOUT, True, session): plugin
+            for plugin in pending
         }
         
-        completed = 0
-        total = len(plugins)
+        completed = len(results)
+        
+        # Cached outputs are ready now; handle them while the others run
+        if on_result:
+            for plugin, output in list(results.items()):
+                on_result(plugin, output)
         
         # Collect results as they complete
         for future in as_completed(future_to_plugin):
@@ -725,6 +1244,8 @@ def run_vol_parallel(plugins: List[str], dump_path: str,
             try:
                 output = future.result()
                 results[plugin] = output
+                if output and cache_dir is not None:
+                    store_cached_output(cache_dir, plugin, output)
                 
                 if progress:
                     status = "✓" if output else "✗"
@@ -743,6 +1264,9 @@ def run_vol_parallel(plugins: List[str], dump_path: str,
                     plugin_display = plugin if len(plugin) <= 30 else plugin[:27] + "..."
                     progress.update("Plugin Execution", completed, total, 
                                   f"✗ {plugin_display} ({completed}/{total})")
+            
+            if on_result:
+                on_result(plugin, results[plugin])
     
     # Store failures in results for later reporting
     results['_failures'] = failures
@@ -754,7 +1278,36 @@ def run_vol_parallel(plugins: List[str], dump_path: str,
 # Output Parsers (Enhanced)
 # ---------------------------------------------------------
 
-def parse_windows_info(raw_output: Optional[str]) -> Optional[Dict[str, str]]:
+# Column separator in Volatility table output: tabs (quick renderer) or
+# runs of 2+ spaces (pretty renderer). Whitespace next to a tab is part of
+# the separator, so fields of a stripped line come out already trimmed.
+# Compiled once for the per-row loops.
+_COLUMN_SPLIT = re.compile(r'\s*\t\s*|\s{2,}')
+_HEADER_PATTERN = re.compile(r'[A-Z][a-z]+.*[A-Z][a-z]+')
+
+# Substrings that identify each plugin's table header row
+_PSLIST_HEADER_MARKERS = ('PID', 'PPID', 'ImageFileName')
+_NETSCAN_HEADER_MARKERS = ('Offset', 'Proto', 'LocalAddr')
+# Leading text of windows.info rows that carry no key/value pair
+_INFO_SKIP_PREFIXES = ('Variable', '===')
+
+# Plugin output as one string, or any iterable of lines (e.g. a pipe's stdout)
+VolOutput = Union[str, Iterable[str]]
+
+
+def _iter_lines(raw_output: VolOutput) -> Iterator[str]:
+    """
+    Iterate over the lines of plugin output.
+    
+    Strings are split without a whole-buffer strip() copy; other iterables
+    are consumed lazily. Callers strip each line themselves.
+    """
+    if isinstance(raw_output, str):
+        return iter(raw_output.splitlines())
+    return iter(raw_output)
+
+
+def parse_windows_info(raw_output: Optional[VolOutput]) -> Optional[Dict[str, str]]:
     """
     Parse windows.info plugin output into structured data.
     
@@ -768,28 +1321,39 @@ def parse_windows_info(raw_output: Optional[str]) -> Optional[Dict[str, str]]:
         return None
     
     parsed = {}
-    lines = raw_output.strip().split('\n')
     
-    for line in lines:
+    for line in _iter_lines(raw_output):
         line = line.strip()
         
         # Skip empty lines and headers
-        if not line or 'Volatility 3' in line or line.startswith('Variable') or line.startswith('==='):
+        if not line or 'Volatility 3' in line or line.startswith(_INFO_SKIP_PREFIXES):
             continue
         
-        # Split by tab or multiple spaces
-        parts = re.split(r'\t+|\s{2,}', line, maxsplit=1)
+        # Split on the first tab; fall back to the first run of 2+ spaces
+        # (pretty renderer) only when the line has no tab at all
+        key, sep, value = line.partition('\t')
+        if not sep:
+            key, sep, value = line.partition('  ')
+            if not sep:
+                continue
         
-        if len(parts) == 2:
-            key = parts[0].strip()
-            value = parts[1].strip()
-            if key and value:
-                parsed[key] = value
+        key = key.strip()
+        value = value.strip()
+        if key and value:
+            parsed[key] = value
     
     return parsed if parsed else None
 
 
-def parse_windows_pslist(raw_output: Optional[str]) -> Optional[List[Dict[str, str]]]:
+# windows.pslist columns in output order; CreateTime/ExitTime may be absent
+_PSLIST_FIELDS = ("PID", "PPID", "ImageFileName", "Offset", "Threads", "Handles",
+                  "SessionId", "Wow64", "CreateTime", "ExitTime")
+# Columns that repeat across rows (svchost.exe, "0", "False", "N/A"): interned
+# so 10k processes share one string object per distinct value
+_PSLIST_INTERNED = (2, 6, 7, 9)
+
+
+def parse_windows_pslist(raw_output: Optional[VolOutput]) -> Optional[List[Dict[str, str]]]:
     """
     Parse windows.pslist plugin output into structured process list.
     
@@ -803,69 +1367,61 @@ def parse_windows_pslist(raw_output: Optional[str]) -> Optional[List[Dict[str, s
         return None
     
     processes = []
-    lines = raw_output.strip().split('\n')
+    lines = _iter_lines(raw_output)
     
     # Find the header line
-    header_idx = -1
-    for i, line in enumerate(lines):
-        if 'PID' in line and 'PPID' in line and 'ImageFileName' in line:
-            header_idx = i
+    for line in lines:
+        if all(marker in line for marker in _PSLIST_HEADER_MARKERS):
             break
-    
-    if header_idx == -1:
+    else:
         return None
     
-    # Process each line after the header
-    for line in lines[header_idx + 1:]:
+    # Process each line after the header (same iterator, no slice copy)
+    for line in lines:
         line = line.strip()
         if not line or line.startswith('==='):
             continue
+        # No column separator means a single field; skip it without the regex
+        if '\t' not in line and '  ' not in line:
+            continue
         
         # Split by tab or multiple spaces
-        parts = re.split(r'\t+|\s{2,}', line)
+        parts = _COLUMN_SPLIT.split(line)
         
         if len(parts) >= 8:
-            process = {
-                "PID": parts[0].strip(),
-                "PPID": parts[1].strip(),
-                "ImageFileName": parts[2].strip(),
-                "Offset": parts[3].strip(),
-                "Threads": parts[4].strip(),
-                "Handles": parts[5].strip(),
-                "SessionId": parts[6].strip(),
-                "Wow64": parts[7].strip(),
-                "CreateTime": parts[8].strip() if len(parts) > 8 else "N/A",
-                "ExitTime": parts[9].strip() if len(parts) > 9 else "N/A"
-            }
-            processes.append(process)
+            # Fields are already trimmed by _COLUMN_SPLIT
+            values = parts[:10]
+            values += ["N/A"] * (10 - len(values))
+            for i in _PSLIST_INTERNED:
+                values[i] = sys.intern(values[i])
+            processes.append(dict(zip(_PSLIST_FIELDS, values)))
     
     return processes if processes else None
 
 
-def parse_windows_netscan(raw_output: Optional[str]) -> Optional[List[Dict[str, str]]]:
+def parse_windows_netscan(raw_output: Optional[VolOutput]) -> Optional[List[Dict[str, str]]]:
     """Parse windows.netscan output for network connections"""
     if not raw_output:
         return None
     
     connections = []
-    lines = raw_output.strip().split('\n')
+    lines = _iter_lines(raw_output)
     
     # Find header
-    header_idx = -1
-    for i, line in enumerate(lines):
-        if 'Offset' in line and 'Proto' in line and 'LocalAddr' in line:
-            header_idx = i
+    for line in lines:
+        if all(marker in line for marker in _NETSCAN_HEADER_MARKERS):
             break
-    
-    if header_idx == -1:
+    else:
         return None
     
-    for line in lines[header_idx + 1:]:
+    for line in lines:
         line = line.strip()
         if not line or line.startswith('==='):
             continue
+        if '\t' not in line and '  ' not in line:
+            continue
         
-        parts = re.split(r'\t+|\s{2,}', line)
+        parts = _COLUMN_SPLIT.split(line)
         if len(parts) >= 5:
             connections.append({
                 "Offset": parts[0].strip(),
@@ -880,39 +1436,51 @@ def parse_windows_netscan(raw_output: Optional[str]) -> Optional[List[Dict[str,
     return connections if connections else None
 
 
-def parse_generic_table(raw_output: Optional[str]) -> Optional[List[Dict[str, str]]]:
-    """Generic parser for table-formatted Volatility output"""
+def parse_generic_table(raw_output: Optional[VolOutput],
+                        limit: Optional[int] = None) -> Optional[List[Dict[str, str]]]:
+    """
+    Generic parser for table-formatted Volatility output.
+    
+    With ``limit`` parsing stops after that many rows, so a sample of a
+    large table (e.g. dlllist) never builds a dict for every row.
+    """
     if not raw_output:
         return None
     
-    lines = raw_output.strip().split('\n')
+    lines = _iter_lines(raw_output)
     
     # Find header line (contains multiple capitalized words)
-    header_idx = -1
     headers = []
     
-    for i, line in enumerate(lines):
-        if re.search(r'[A-Z][a-z]+.*[A-Z][a-z]+', line):
+    for line in lines:
+        line = line.strip()
+        # A header has 2+ columns; check for a separator before the regexes
+        if '\t' not in line and '  ' not in line:
+            continue
+        if _HEADER_PATTERN.search(line):
             # Potential header line
-            parts = re.split(r'\t+|\s{2,}', line.strip())
+            parts = _COLUMN_SPLIT.split(line)
             if len(parts) >= 2:
-                header_idx = i
                 headers = [h.strip() for h in parts]
                 break
     
-    if header_idx == -1 or not headers:
+    if not headers:
         return None
     
     results = []
-    for line in lines[header_idx + 1:]:
+    for line in lines:
         line = line.strip()
         if not line or line.startswith('==='):
             continue
+        if '\t' not in line and '  ' not in line:
+            continue
         
-        parts = re.split(r'\t+|\s{2,}', line)
+        parts = _COLUMN_SPLIT.split(line)
         if len(parts) >= len(headers):
             row = {headers[i]: parts[i].strip() for i in range(len(headers))}
             results.append(row)
+            if len(results) == limit:
+                break
     
     return results if results else None
 
@@ -921,42 +1489,140 @@ def parse_generic_table(raw_output: Optional[str]) -> Optional[List[Dict[str, st
 # File Hashing
 # ---------------------------------------------------------
 
-def file_hashes(path: str, progress: Optional[ProgressTracker] = None) -> Dict[str, str]:
+def _read_chunks(f) -> Iterator[Any]:
+    """
+    Yield BUFFER_SIZE chunks of an open file.
+    
+    Chunks are zero-copy views into an mmap of the file when it can be
+    mapped, otherwise reads into one reused buffer (empty files, 32-bit
+    address space limits). Each chunk is only valid until the next one is
+    requested. Either way the kernel is told the access is sequential so
+    it widens readahead (no-op where the hint isn't available).
     """
-    Calculate MD5, SHA1, and SHA256 hashes of a file.
+    try:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError, OverflowError):
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        buffer = bytearray(BUFFER_SIZE)
+        with memoryview(buffer) as view:
+            while n := f.readinto(buffer):
+                with view[:n] as chunk:
+                    yield chunk
+        return
+    
+    if hasattr(mmap, "MADV_SEQUENTIAL"):
+        mm.madvise(mmap.MADV_SEQUENTIAL)
+    
+    with mm, memoryview(mm) as view:
+        for offset in range(0, len(mm), BUFFER_SIZE):
+            with view[offset:offset + BUFFER_SIZE] as chunk:
+                yield chunk
+
+
+def _hash_file(path: str, hasher: Any, on_chunk: Optional[Callable[[int], None]] = None,
+               cancel: Optional[threading.Event] = None) -> None:
+    """Feed a whole file through one hasher, reporting each chunk's size"""
+    with open(path, "rb") as f:
+        for chunk in _read_chunks(f):
+            if cancel is not None and cancel.is_set():
+                raise MemflowError("Hashing cancelled")
+            hasher.update(chunk)
+            if on_chunk:
+                on_chunk(len(chunk))
+
+
+def file_hashes(path: str, progress: Optional[ProgressTracker] = None,
+                legacy: bool = False, use_blake3: bool = False,
+                cancel: Optional[threading.Event] = None) -> Dict[str, str]:
+    """
+    Calculate the SHA256 hash of a file, plus MD5 and SHA1 if requested.
+    
+    SHA256 goes through OpenSSL, which uses SHA-NI where available. With
+    ``use_blake3`` a BLAKE3 digest (several times faster, hashed across
+    all cores) replaces SHA256; it needs the optional ``blake3`` package.
+    
+    With ``legacy`` each digest runs in its own thread over its own mapping
+    of the file (hashlib releases the GIL on large buffers). The threads
+    don't wait on each other per chunk, so the total time is that of the
+    slowest digest, and the file comes off disk once: whichever thread is
+    ahead faults the pages in, the others hit the page cache. The leader is
+    held within ``HASH_MAX_DRIFT`` of the slowest digest, so on dumps larger
+    than RAM those pages are still cached when the trailing threads arrive.
     
     Args:
         path: Path to the file
         progress: Optional progress tracker
+        legacy: Also compute MD5 and SHA1 (e.g. for older case files)
+        use_blake3: Compute BLAKE3 instead of SHA256
+        cancel: Optional event; once set, hashing stops at the next chunk
+            and raises MemflowError
         
     Returns:
         Dictionary containing hash values
     """
-    md5 = hashlib.md5()
-    sha1 = hashlib.sha1()
-    sha256 = hashlib.sha256()
+    if use_blake3 and blake3 is None:
+        raise MemflowError("BLAKE3 hashing requested but the blake3 package is not installed")
+    
+    hashers = {}
+    if legacy:
+        hashers["md5"] = hashlib.new("md5", usedforsecurity=False)
+        hashers["sha1"] = hashlib.new("sha1", usedforsecurity=False)
+    # The primary digest drives progress reporting
+    if use_blake3:
+        primary = "blake3"
+        hashers[primary] = blake3.blake3(max_threads=blake3.blake3.AUTO)
+    else:
+        primary = "sha256"
+        hashers[primary] = hashlib.new("sha256")
 
     try:
         file_size = os.path.getsize(path)
         bytes_read = 0
+        # Report at 1% granularity: ~100 callbacks per dump regardless of size
+        report_step = max(file_size // 100, 1)
+        next_report = report_step
         
-        with open(path, "rb") as f:
-            while chunk := f.read(BUFFER_SIZE):
-                md5.update(chunk)
-                sha1.update(chunk)
-                sha256.update(chunk)
-                
-                bytes_read += len(chunk)
-                
-                if progress and file_size > 0:
-                    progress.update("Hashing", bytes_read, file_size, 
-                                  f"Calculating hashes ({bytes_read / file_size * 100:.1f}%)")
+        def report(chunk_len: int) -> None:
+            nonlocal bytes_read, next_report
+            bytes_read += chunk_len
+            if progress and (bytes_read >= next_report or bytes_read == file_size):
+                next_report = bytes_read + report_step
+                progress.update("Hashing", bytes_read, file_size, 
+                              "Calculating hashes (%.1f%%)" % (bytes_read / file_size * 100))
+        
+        if len(hashers) == 1:
+            _hash_file(path, hashers[primary], report, cancel)
+        else:
+            # Bytes hashed per digest; a finished (or failed) digest is set to
+            # infinity so it never holds the others back
+            positions = dict.fromkeys(hashers, 0)
+            drift = threading.Condition()
+            
+            def pace(name: str, chunk_len: int) -> None:
+                with drift:
+                    positions[name] += chunk_len
+                    drift.notify_all()
+                    while positions[name] - min(positions.values()) > HASH_MAX_DRIFT:
+                        drift.wait()
+                if name == primary:
+                    report(chunk_len)
+            
+            def hash_paced(name: str) -> None:
+                try:
+                    _hash_file(path, hashers[name], functools.partial(pace, name), cancel)
+                finally:
+                    with drift:
+                        positions[name] = float("inf")
+                        drift.notify_all()
+            
+            # Progress follows the primary digest
+            with ThreadPoolExecutor(max_workers=len(hashers)) as pool:
+                futures = [pool.submit(hash_paced, name) for name in hashers]
+                for future in futures:
+                    future.result()
 
-        return {
-            "md5": md5.hexdigest(),
-            "sha1": sha1.hexdigest(),
-            "sha256": sha256.hexdigest()
-        }
+        return {name: h.hexdigest() for name, h in hashers.items()}
     except Exception as e:
         raise MemflowError(f"Failed to calculate hashes: {e}")
 
@@ -965,6 +1631,17 @@ def file_hashes(path: str, progress: Optional[ProgressTracker] = None) -> Dict[s
 # Analysis Helpers (Enhanced)
 # ---------------------------------------------------------
 
+# Windows version names keyed by (NtMajorVersion, NtMinorVersion)
+WINDOWS_VERSIONS = {
+    ("6", "0"): "Windows Vista / Server 2008",
+    ("6", "1"): "Windows 7 / Server 2008 R2",
+    ("6", "2"): "Windows 8 / Server 2012",
+    ("6", "3"): "Windows 8.1 / Server 2012 R2",
+    ("10", "0"): "Windows 10 / Server 2016+",
+    ("11", "0"): "Windows 11",
+}
+
+
 def extract_os_info(windows_info: Optional[Dict[str, str]]) -> Dict[str, Any]:
     """
     Extract and format OS information from windows.info output.
@@ -985,19 +1662,15 @@ def extract_os_info(windows_info: Optional[Dict[str, str]]) -> Dict[str, Any]:
     build = windows_info.get("NTBuildLab", "")
     
     # Determine Windows version
-    version_name = "Unknown Windows"
-    if major == "6" and minor == "0":
-        version_name = "Windows Vista / Server 2008"
-    elif major == "6" and minor == "1":
-        version_name = "Windows 7 / Server 2008 R2"
-    elif major == "6" and minor == "2":
-        version_name = "Windows 8 / Server 2012"
-    elif major == "6" and minor == "3":
-        version_name = "Windows 8.1 / Server 2012 R2"
-    elif major == "10" and minor == "0":
-        version_name = "Windows 10 / Server 2016+"
-    elif major == "11" and minor == "0":
-        version_name = "Windows 11"
+    version_name = WINDOWS_VERSIONS.get((major, minor), "Unknown Windows")
+    
+    # Determine architecture (PAE takes precedence, as before)
+    if windows_info.get("IsPAE") == "True":
+        architecture = "x86 (32-bit PAE)"
+    elif windows_info.get("Is64Bit") == "True":
+        architecture = "x64 (64-bit)"
+    else:
+        architecture = "x86 (32-bit)"
     
     return {
         "detected": True,
@@ -1006,13 +1679,39 @@ def extract_os_info(windows_info: Optional[Dict[str, str]]) -> Dict[str, Any]:
         "version_numbers": f"{major}.{minor}",
         "product_type": product,
         "build_lab": build,
-        "architecture": "x86 (32-bit PAE)" if windows_info.get("IsPAE") == "True" else "x64 (64-bit)" if windows_info.get("Is64Bit") == "True" else "x86 (32-bit)",
+        "architecture": architecture,
         "system_time": windows_info.get("SystemTime", "Unknown"),
         "system_root": windows_info.get("NtSystemRoot", "Unknown"),
         "kernel_base": windows_info.get("KernelBase", windows_info.get("Kernel Base", "Unknown"))
     }
 
 
+# Process classification lists, lower-cased once at import
+BROWSER_NAMES = ("iexplore.exe", "firefox.exe", "chrome.exe", "msedge.exe", "opera.exe", "brave.exe")
+SYSTEM_NAMES = frozenset(name.lower() for name in
+                         ["System", "smss.exe", "csrss.exe", "wininit.exe", "services.exe", "lsass.exe", "svchost.exe"])
+SUSPICIOUS_INDICATORS = tuple(name.lower() for name in
+                              ["FTK Imager.exe", "winpmem", "dumpit", "procdump", "mimikatz", "psexec"])
+MAX_USER_APPS = 10  # Unique session-1 applications listed in the report
+
+# Substring matchers for the lists above: one regex search per name instead
+# of one `in` test per pattern
+_BROWSER_RE = re.compile("|".join(map(re.escape, BROWSER_NAMES)))
+_SUSPICIOUS_RE = re.compile("|".join(map(re.escape, SUSPICIOUS_INDICATORS)))
+
+
+def _classify_process_name(name: str) -> str:
+    """Return "browser", "system", "suspicious" or "" for a process image name"""
+    name_lower = name.lower()
+    if _BROWSER_RE.search(name_lower):
+        return "browser"
+    if name_lower in SYSTEM_NAMES:
+        return "system"
+    if _SUSPICIOUS_RE.search(name_lower):
+        return "suspicious"
+    return ""
+
+
 def analyze_processes(processes: Optional[List[Dict[str, str]]]) -> Dict[str, Any]:
     """
     Analyze process list and extract insights.
@@ -1031,46 +1730,66 @@ def analyze_processes(processes: Optional[List[Dict[str, str]]]) -> Dict[str, An
         "browsers": [],
         "system": [],
         "suspicious": [],
-        "user_apps": []
+        "user_apps": {}  # Used as an ordered set: first-seen order, no duplicates
     }
-    
-    browser_names = ["iexplore.exe", "firefox.exe", "chrome.exe", "msedge.exe", "opera.exe", "brave.exe"]
-    system_names = ["System", "smss.exe", "csrss.exe", "wininit.exe", "services.exe", "lsass.exe", "svchost.exe"]
-    suspicious_indicators = ["FTK Imager.exe", "winpmem", "dumpit", "procdump", "mimikatz", "psexec"]
-    
+    running = 0
+    # Image names repeat across rows (and are interned by the parser), so
+    # each distinct name is lowercased and matched against the lists once
+    category_by_name = {}
+    
+    # Bound once: the loop body runs per process row
+    add_browser = interesting["browsers"].append
+    add_system = interesting["system"].append
+    add_suspicious = interesting["suspicious"].append
+    user_apps = interesting["user_apps"]
+    cached_category = category_by_name.get
+    
+    # Single pass: classification and running/exited counts together
     for proc in processes:
-        name = proc.get("ImageFileName", "")
+        get = proc.get
+        name = get("ImageFileName", "")
+        category = cached_category(name)
+        if category is None:
+            category = category_by_name[name] = _classify_process_name(name)
         
-        if any(browser in name.lower() for browser in browser_names):
-            interesting["browsers"].append({
+        if get("ExitTime") == "N/A":
+            running += 1
+        
+        if category == "browser":
+            add_browser({
                 "name": name,
-                "pid": proc.get("PID"),
-                "created": proc.get("CreateTime")
+                "pid": get("PID"),
+                "created": get("CreateTime")
             })
-        elif any(sys_name.lower() == name.lower() for sys_name in system_names):
-            interesting["system"].append(name)
-        elif any(susp.lower() in name.lower() for susp in suspicious_indicators):
-            interesting["suspicious"].append({
+        elif category == "system":
+            add_system(name)
+        elif category == "suspicious":
+            add_suspicious({
                 "name": name,
-                "pid": proc.get("PID"),
-                "created": proc.get("CreateTime")
+                "pid": get("PID"),
+                "created": get("CreateTime")
             })
-        elif proc.get("SessionId") == "1" and name not in system_names:
-            interesting["user_apps"].append(name)
+        elif len(user_apps) < MAX_USER_APPS and get("SessionId") == "1":
+            # Only the first few are reported, so stop collecting once full
+            user_apps.setdefault(name)
     
     return {
         "detected": True,
         "total_count": len(processes),
-        "running_processes": len([p for p in processes if p.get("ExitTime") == "N/A"]),
-        "exited_processes": len([p for p in processes if p.get("ExitTime") != "N/A"]),
+        "running_processes": running,
+        "exited_processes": len(processes) - running,
         "interesting_findings": {
             "browsers": interesting["browsers"],
             "suspicious_processes": interesting["suspicious"],
-            "user_applications": list(set(interesting["user_apps"]))[:10]  # Top 10 unique
+            "user_applications": list(interesting["user_apps"])
         }
     }
 
 
+# Foreign addresses that never identify a remote peer (loopback is checked by prefix)
+_NON_REMOTE_IPS = frozenset({"", "0.0.0.0", "*"})
+
+
 def analyze_network(connections: Optional[List[Dict[str, str]]], 
                    plugin_failed: bool = False,
                    plugin_level: str = "essential") -> Dict[str, Any]:
@@ -1101,26 +1820,29 @@ def analyze_network(connections: Optional[List[Dict[str, str]]],
                 "failure_type": "no_data"
             }
     
-    # Categorize connections
-    established = [c for c in connections if c.get("State") == "ESTABLISHED"]
-    listening = [c for c in connections if c.get("State") == "LISTENING"]
-    
-    # Extract unique remote IPs
-    remote_ips = set()
+    # Single pass: state counts and unique remote IPs together
+    established = listening = 0
+    remote_ips = {}  # Used as an ordered set: first-seen order, no duplicates
+    add_remote_ip = remote_ips.setdefault
     for conn in connections:
-        foreign = conn.get("ForeignAddr", "")
-        if ":" in foreign:
-            ip = foreign.split(":")[0]
-            if ip and ip != "0.0.0.0" and ip != "*" and not ip.startswith("127."):
-                remote_ips.add(ip)
+        get = conn.get
+        state = get("State")
+        if state == "ESTABLISHED":
+            established += 1
+        elif state == "LISTENING":
+            listening += 1
+        
+        ip, sep, _ = get("ForeignAddr", "").partition(":")
+        if sep and ip not in _NON_REMOTE_IPS and not ip.startswith("127."):
+            add_remote_ip(ip)
     
     return {
         "detected": True,
         "total_connections": len(connections),
-        "established": len(established),
-        "listening": len(listening),
+        "established": established,
+        "listening": listening,
         "unique_remote_ips": len(remote_ips),
-        "remote_ips": list(remote_ips)[:20],  # Limit to 20
+        "remote_ips": list(islice(remote_ips, 20)),  # Limit to 20
         "sample_connections": connections[:10]  # First 10 connections
     }
 
@@ -1189,7 +1911,14 @@ def determine_os_confidence(os_detection: Tuple[OSType, List[str], int],
 def full_analysis(path: str, 
                  progress_callback: Optional[Callable[[AnalysisProgress], None]] = None,
                  plugin_level: str = "essential",
-                 use_color: bool = None) -> Dict[str, Any]:
+                 use_color: bool = None,
+                 force: bool = False,
+                 legacy_hashes: bool = False,
+                 use_blake3: bool = False,
+                 use_cache: bool = False,
+                 keep_raw: bool = True,
+                 assume_os: Optional[OSType] = None,
+                 in_process: bool = False) -> Dict[str, Any]:
     """
     Perform comprehensive analysis of a memory dump file.
     
@@ -1198,6 +1927,19 @@ def full_analysis(path: str,
         progress_callback: Optional callback for progress updates (for background integration)
         plugin_level: Plugin execution level - "essential", "standard", "advanced", "full"
         use_color: Whether to use colored output (auto-detected if None)
+        force: Analyze even if the file has no recognizable dump or OS signature
+        legacy_hashes: Also compute MD5 and SHA1 alongside SHA256
+        use_blake3: Hash with BLAKE3 instead of SHA256 (needs the blake3 package)
+        use_cache: Reuse plugin output cached from earlier runs on the same
+            dump (same digest and Volatility3 version), and cache new output
+        keep_raw: Include the full parsed process and connection lists in
+            raw_volatility_data (the rule engine reads them); when False
+            they are dropped once summarized
+        assume_os: Known OS of the dump; skips the heuristic signature scan
+            (Volatility output still confirms or contradicts it)
+        in_process: Run plugins inside this interpreter on one shared
+            Volatility3 context (serialized) instead of parallel `vol`
+            subprocesses; falls back to subprocesses if unavailable
         
     Returns:
         Dictionary containing complete analysis results
@@ -1208,7 +1950,7 @@ def full_analysis(path: str,
     
     # Track timing for each stage
     stage_timings = {}
-    analysis_start_time = time.time()
+    analysis_start_time = time.perf_counter()
     
     # Initialize progress tracker
     progress = ProgressTracker(progress_callback)
@@ -1243,66 +1985,127 @@ def full_analysis(path: str,
     human_size = _format_size(size_bytes)
     
     # Format detection
-    stage_start = time.time()
+    stage_start = time.perf_counter()
     print(colorize("\n[*] Detecting dump format...", ColorCode.BLUE, use_color))
     format_info = detect_dump_format(path, progress)
-    stage_timings['format_detection'] = time.time() - stage_start
+    stage_timings['format_detection'] = time.perf_counter() - stage_start
     print(colorize(f"\n[+] Format: {format_info.format_type.value} (confidence: {format_info.confidence}%)", ColorCode.GREEN, use_color) + 
           colorize(f" [{format_elapsed_time(stage_timings['format_detection'])}]", ColorCode.GRAY, use_color))
     
-    # Calculate hashes
-    stage_start = time.time()
-    print(colorize("\n[*] Calculating file hashes...", ColorCode.BLUE, use_color))
-    hashes = file_hashes(path, progress)
-    stage_timings['hashing'] = time.time() - stage_start
-    print(colorize(f"[+] Hashes calculated", ColorCode.GREEN, use_color) + 
-          colorize(f" [{format_elapsed_time(stage_timings['hashing'])}]", ColorCode.GRAY, use_color))
-
     # Enhanced OS detection
-    stage_start = time.time()
-    print(colorize("\n[*] Running enhanced OS detection...", ColorCode.BLUE, use_color))
-    os_detection = enhanced_os_detection(path, progress)
+    stage_start = time.perf_counter()
+    if assume_os is not None:
+        os_detection = (assume_os, [f"OS asserted by user: {assume_os.value}"], ASSUMED_OS_CONFIDENCE)
+    else:
+        print(colorize("\n[*] Running enhanced OS detection...", ColorCode.BLUE, use_color))
+        os_detection = enhanced_os_detection(path, progress)
     os_type, evidence, confidence = os_detection
-    stage_timings['os_detection'] = time.time() - stage_start
+    stage_timings['os_detection'] = time.perf_counter() - stage_start
     
     print(colorize(f"\n[+] OS Detection: {os_type.value} (confidence: {confidence}%)", ColorCode.GREEN, use_color) + 
           colorize(f" [{format_elapsed_time(stage_timings['os_detection'])}]", ColorCode.GRAY, use_color))
     
-    # Determine which plugins to run
-    plugins_to_run = _select_plugins(os_type, plugin_level)
-    
-    stage_start = time.time()
-    print(colorize(f"\n[*] Running {len(plugins_to_run)} Volatility3 plugins...", ColorCode.BLUE, use_color))
-    
-    # Run plugins in parallel
-    plugin_results = run_vol_parallel(plugins_to_run, path, progress)
-    stage_timings['plugin_execution'] = time.time() - stage_start
+    # Both probes only read the header and a short sample. Without a dump
+    # magic or any OS signature the file is almost certainly not a memory
+    # dump, so fail now rather than after hashing and running every plugin.
+    if not force and format_info.format_type == DumpFormat.RAW and confidence == 0:
+        raise MemflowError(
+            "File has no recognizable memory-dump or OS signature "
+            "(use --force to analyze it anyway)"
+        )
     
-    # Extract failures and remove from results
-    failures = plugin_results.pop('_failures', {})
+    # Calculate hashes in the background: they don't depend on any later
+    # stage and hashlib releases the GIL, so hashing overlaps plugin
+    # execution instead of running before it
+    print(colorize("\n[*] Calculating file hashes in the background...", ColorCode.BLUE, use_color))
     
-    # Count successful plugins
-    successful = sum(1 for v in plugin_results.values() if v is not None)
-    success_msg = f"\n[+] Completed: {successful}/{len(plugins_to_run)} plugins successful"
-    print(colorize(success_msg, ColorCode.GREEN if successful == len(plugins_to_run) else ColorCode.YELLOW, use_color) + 
-          colorize(f" [{format_elapsed_time(stage_timings['plugin_execution'])}]", ColorCode.GRAY, use_color))
+    hash_cancel = threading.Event()
     
-    # Report failures if any
-    if failures:
-        print(colorize(f"[!] {len(failures)} plugin(s) failed:", ColorCode.YELLOW, use_color))
-        for plugin, reason in list(failures.items())[:3]:  # Show first 3
-            print(colorize(f"    - {plugin}: {reason[:60]}", ColorCode.RED, use_color))
+    def hash_in_background() -> Dict[str, str]:
+        hash_start = time.perf_counter()
+        # ProgressTracker is lock-protected, so the hash thread reports its
+        # "Hashing" stage alongside the plugin updates
+        result = file_hashes(path, progress, legacy=legacy_hashes, use_blake3=use_blake3,
+                             cancel=hash_cancel)
+        stage_timings['hashing'] = time.perf_counter() - hash_start
+        return result
     
-    # Parse outputs
-    progress.update("Analysis", 0, 5, "Parsing plugin outputs")
+    hash_executor = ThreadPoolExecutor(max_workers=1)
+    hash_future = hash_executor.submit(hash_in_background)
     
-    windows_info = parse_windows_info(plugin_results.get("windows.info"))
-    processes = parse_windows_pslist(plugin_results.get("windows.pslist"))
-    network_connections = parse_windows_netscan(plugin_results.get("windows.netscan"))
+    try:
+        # The cache is keyed by the dump's digest, so with the cache on the
+        # plugins wait for hashing instead of overlapping it
+        cache_dir = analysis_cache_dir(hash_future.result()) if use_cache else None
+        
+        # Determine which plugins to run
+        plugins_to_run = _select_plugins(os_type, plugin_level)
+        
+        stage_start = time.perf_counter()
+        print(colorize(f"\n[*] Running {len(plugins_to_run)} Volatility3 plugins...", ColorCode.BLUE, use_color))
+        
+        # Parsers for the plugin outputs the report reads. Each runs as soon as
+        # its plugin finishes, overlapping the plugins still running.
+        parsers = {
+            "windows.info": parse_windows_info,
+            "windows.pslist": parse_windows_pslist,
+            "windows.netscan": parse_windows_netscan,
+            # The report only keeps a sample of these
+            "windows.cmdline": functools.partial(parse_generic_table, limit=20),
+            "windows.dlllist": functools.partial(parse_generic_table, limit=10),
+        }
+        parsed = {}
+        
+        def parse_on_completion(plugin: str, output: Optional[str]) -> None:
+            parser = parsers.get(plugin)
+            if parser is not None:
+                parsed[plugin] = parser(output)
+        
+        # The session lives for this analysis only, so its Context and layers
+        # are released before the next dump (e.g. in a long-running worker)
+        session = open_in_process_volatility(path) if in_process else None
+        try:
+            # Run plugins in parallel
+            plugin_results = run_vol_parallel(plugins_to_run, path, progress, cache_dir=cache_dir,
+                                              on_result=parse_on_completion, session=session)
+        finally:
+            if session is not None:
+                session.close()
+        stage_timings['plugin_execution'] = time.perf_counter() - stage_start
+        
+        # Extract failures and remove from results
+        failures = plugin_results.pop('_failures', {})
+        
+        # Count successful plugins
+        successful = sum(1 for v in plugin_results.values() if v is not None)
+        success_msg = f"\n[+] Completed: {successful}/{len(plugins_to_run)} plugins successful"
+        print(colorize(success_msg, ColorCode.GREEN if successful == len(plugins_to_run) else ColorCode.YELLOW, use_color) + 
+              colorize(f" [{format_elapsed_time(stage_timings['plugin_execution'])}]", ColorCode.GRAY, use_color))
+        
+        # Report failures if any
+        if failures:
+            print(colorize(f"[!] {len(failures)} plugin(s) failed:", ColorCode.YELLOW, use_color))
+            for plugin, reason in list(failures.items())[:3]:  # Show first 3
+                print(colorize(f"    - {plugin}: {reason[:60]}", ColorCode.RED, use_color))
+        
+        # Collect the background hashes
+        hashes = hash_future.result()
+    finally:
+        # If a stage above raised, stop the hash thread (it checks between
+        # chunks) and wait for it instead of leaving it reading the dump
+        hash_cancel.set()
+        hash_executor.shutdown(wait=True)
+    print(colorize(f"[+] Hashes calculated", ColorCode.GREEN, use_color) + 
+          colorize(f" [{format_elapsed_time(stage_timings['hashing'])}]", ColorCode.GRAY, use_color))
     
-    # Additional parsers for other plugins
-    cmdline_data = parse_generic_table(plugin_results.get("windows.cmdline"))
-    dll_data = parse_generic_table(plugin_results.get("windows.dlllist"))
+    # Outputs were parsed as their plugins finished; plugins not selected
+    # at this level have no entry
+    progress.update("Analysis", 0, 5, "Collecting parsed plugin outputs")
+    windows_info = parsed.get("windows.info")
+    processes = parsed.get("windows.pslist")
+    network_connections = parsed.get("windows.netscan")
+    cmdline_data = parsed.get("windows.cmdline")
+    dll_data = parsed.get("windows.dlllist")
     
     progress.update("Analysis", 1, 5, "Analyzing system information")
     
@@ -1322,8 +2125,7 @@ def full_analysis(path: str,
     # Check if network plugins failed
     network_plugin_failed = all(
         plugin_results.get(p) is None 
-        for p in ['windows.netscan', 'windows.netstat', 'linux.sockstat', 'mac.netstat']
-        if p in plugins_to_run
+        for p in NETWORK_PLUGINS.intersection(plugins_to_run)
     )
     network_analysis = analyze_network(network_connections, network_plugin_failed, plugin_level)
     
@@ -1356,18 +2158,18 @@ def full_analysis(path: str,
         "process_analysis": process_analysis,
         "network_analysis": network_analysis,
         "advanced_artifacts": {
-            "command_lines": cmdline_data[:20] if cmdline_data else None,  # Limit output
-            "loaded_dlls_sample": dll_data[:10] if dll_data else None,
+            "command_lines": cmdline_data,
+            "loaded_dlls_sample": dll_data,
         },
         "raw_volatility_data": {
             "windows_info": windows_info if windows_info else None,
-            "process_list": processes if processes else None,
-            "network_connections": network_connections if network_connections else None,
+            "process_list": processes if keep_raw and processes else None,
+            "network_connections": network_connections if keep_raw and network_connections else None,
             "plugins_attempted": {plugin: (result is not None) for plugin, result in plugin_results.items()}
         },
         "plugin_failures": failures if failures else None,
         "performance": {
-            "total_time": time.time() - analysis_start_time,
+            "total_time": time.perf_counter() - analysis_start_time,
             "stage_timings": stage_timings
         },
         "analysis_level": plugin_level  # Store for reference
@@ -1382,47 +2184,49 @@ def full_analysis(path: str,
 
 
 def _select_plugins(os_type: OSType, level: str) -> List[str]:
-    """Select plugins to run based on OS and level"""
-    plugins = []
+    """Select plugins to run based on OS and level, without duplicates"""
+    # dict as an ordered set: a plugin listed in two tiers is only run once
+    plugins: Dict[str, None] = {}
     
     if os_type == OSType.WINDOWS:
-        plugins.extend(WINDOWS_PLUGINS['essential'])
+        plugins.update(dict.fromkeys(WINDOWS_PLUGINS['essential']))
         if level in ['standard', 'advanced', 'full']:
-            plugins.extend(WINDOWS_PLUGINS['network'])
+            plugins.update(dict.fromkeys(WINDOWS_PLUGINS['network']))
         if level in ['advanced', 'full']:
-            plugins.extend(WINDOWS_PLUGINS['malware'])
+            plugins.update(dict.fromkeys(WINDOWS_PLUGINS['malware']))
         if level == 'full':
-            plugins.extend(WINDOWS_PLUGINS['advanced'])
+            plugins.update(dict.fromkeys(WINDOWS_PLUGINS['advanced']))
     
     elif os_type == OSType.LINUX:
-        plugins.extend(LINUX_PLUGINS['essential'])
+        plugins.update(dict.fromkeys(LINUX_PLUGINS['essential']))
         if level in ['standard', 'advanced', 'full']:
-            plugins.extend(LINUX_PLUGINS['network'])
+            plugins.update(dict.fromkeys(LINUX_PLUGINS['network']))
         if level in ['advanced', 'full']:
-            plugins.extend(LINUX_PLUGINS['advanced'])
+            plugins.update(dict.fromkeys(LINUX_PLUGINS['advanced']))
     
     elif os_type == OSType.MACOS:
-        plugins.extend(MACOS_PLUGINS['essential'])
+        plugins.update(dict.fromkeys(MACOS_PLUGINS['essential']))
         if level in ['standard', 'advanced', 'full']:
-            plugins.extend(MACOS_PLUGINS['network'])
+            plugins.update(dict.fromkeys(MACOS_PLUGINS['network']))
         if level in ['advanced', 'full']:
-            plugins.extend(MACOS_PLUGINS['advanced'])
+            plugins.update(dict.fromkeys(MACOS_PLUGINS['advanced']))
     
     else:
         # Unknown OS - try essential plugins from all
-        plugins.extend(WINDOWS_PLUGINS['essential'])
-        plugins.extend(LINUX_PLUGINS['essential'][:2])  # Just a couple
+        plugins.update(dict.fromkeys(WINDOWS_PLUGINS['essential']))
+        plugins.update(dict.fromkeys(LINUX_PLUGINS['essential'][:2]))  # Just a couple
     
-    return plugins
+    return list(plugins)
+
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
 
 
 def _format_size(bytes_size: int) -> str:
     """Format byte size to human-readable string."""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if bytes_size < 1024.0:
-            return f"{bytes_size:.2f} {unit}"
-        bytes_size /= 1024.0
-    return f"{bytes_size:.2f} PB"
+    # Each unit is 10 more bits: pick it from the bit length, divide once
+    unit_idx = min((bytes_size.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1) if bytes_size > 0 else 0
+    return f"{bytes_size / (1 << (unit_idx * 10)):.2f} {_SIZE_UNITS[unit_idx]}"
 
 
 # ---------------------------------------------------------
@@ -1445,7 +2249,11 @@ class MemflowAnalyzer:
         self.progress_callback = progress_callback
         self._current_analysis = None
     
-    def analyze(self, dump_path: str, plugin_level: str = "essential", use_color: bool = None) -> Dict[str, Any]:
+    def analyze(self, dump_path: str, plugin_level: str = "essential", use_color: bool = None,
+                force: bool = False, legacy_hashes: bool = False,
+                use_blake3: bool = False, use_cache: bool = False,
+                keep_raw: bool = True, assume_os: Optional[OSType] = None,
+                in_process: bool = False) -> Dict[str, Any]:
         """
         Analyze a memory dump file.
         
@@ -1453,11 +2261,20 @@ class MemflowAnalyzer:
             dump_path: Path to memory dump
             plugin_level: Analysis depth - "essential", "standard", "advanced", "full"
             use_color: Whether to use colored output (auto-detected if None)
+            force: Skip the dump-signature check
+            legacy_hashes: Also compute MD5 and SHA1
+            use_blake3: Hash with BLAKE3 instead of SHA256
+            use_cache: Reuse and store cached plugin output for this dump
+            keep_raw: Keep the full process and connection lists in the result
+            assume_os: Known OS of the dump, skipping heuristic OS detection
+            in_process: Run plugins in-process on a shared Volatility3 context
             
         Returns:
             Analysis results dictionary
         """
-        return full_analysis(dump_path, self.progress_callback, plugin_level, use_color)
+        return full_analysis(dump_path, self.progress_callback, plugin_level, use_color,
+                             force, legacy_hashes, use_blake3, use_cache, keep_raw, assume_os,
+                             in_process)
     
     def quick_scan(self, dump_path: str) -> Dict[str, Any]:
         """
@@ -1559,21 +2376,86 @@ Examples:
         action="store_true",
         help="Show detailed output including raw volatility data"
     )
+    
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Analyze the file even if no memory-dump or OS signature is found"
+    )
+    
+    parser.add_argument(
+        "--legacy-hashes",
+        action="store_true",
+        help="Also compute MD5 and SHA1 alongside the primary digest"
+    )
+    
+    parser.add_argument(
+        "--blake3",
+        action="store_true",
+        help="Hash with BLAKE3 instead of SHA256 (requires the blake3 package)"
+    )
+    
+    parser.add_argument(
+        "--cache",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Reuse plugin output from earlier runs on the same dump, stored "
+             "under ~/.cache/memflow (default: off)"
+    )
+    
+    parser.add_argument(
+        "--keep-raw",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="Keep the full process and connection lists in the result "
+             "(default: only with --json or --verbose)"
+    )
+    
+    parser.add_argument(
+        "--assume-os",
+        choices=["windows", "linux", "macos", "auto"],
+        default="auto",
+        help="Skip heuristic OS detection and treat the dump as this OS (default: auto)"
+    )
+    
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="Run plugins one at a time inside this process on a shared Volatility3 "
+             "context instead of parallel vol subprocesses"
+    )
 
     args = parser.parse_args()
+    
+    # Fail before any analysis work rather than in the background hasher
+    if args.blake3 and blake3 is None:
+        parser.error("--blake3 requires the blake3 package (pip install blake3)")
 
     try:
         # Get terminal width for proper line clearing
         term_width = get_terminal_width()
         
-        # Simple progress printer for CLI with proper line clearing
+        # Clear the line by padding with spaces based on terminal width
+        line_format = f"\r{{:<{term_width}}}"
+        last_stage = None
+        last_print = 0.0
+        
+        # Simple progress printer for CLI with proper line clearing, redrawn
+        # at most PROGRESS_REDRAW_INTERVAL apart within a stage (stage
+        # changes and stage completion are always shown)
         def print_progress(progress: AnalysisProgress):
-            # Clear the line by padding with spaces based on terminal width
+            nonlocal last_stage, last_print
+            now = time.monotonic()
+            if (progress.stage == last_stage and progress.current < progress.total
+                    and now - last_print < PROGRESS_REDRAW_INTERVAL):
+                return
+            last_stage, last_print = progress.stage, now
+            
             msg = f"[{progress.percentage:5.1f}%] {progress.stage}: {progress.message}"
             # Truncate message if it exceeds terminal width
             if len(msg) > term_width - 1:
                 msg = msg[:term_width - 4] + "..."
-            print(f"\r{msg:<{term_width}}", end='', flush=True)
+            print(line_format.format(msg), end='', flush=True)
         
         analyzer = MemflowAnalyzer(progress_callback=print_progress)
         
@@ -1600,15 +2482,19 @@ Examples:
             print(f"OS: {result['os']['type']} ({result['os']['confidence']}% confidence)")
             
             if args.json_out:
-                with open(args.json_out, "w", encoding="utf-8") as f:
-                    json.dump(result, f, indent=2, ensure_ascii=False)
+                write_json_report(result, args.json_out)
                 print(f"\n[+] Results saved -> {args.json_out}")
         
         elif args.mode == "full":
             print(f"[*] Starting full analysis of: {args.dump}")
             print(f"[*] Analysis level: {args.level}\n")
             
-            result = analyzer.analyze(args.dump, args.level, use_color)
+            # Raw lists are only read by the JSON report and verbose output
+            keep_raw = args.keep_raw if args.keep_raw is not None else bool(args.json_out or args.verbose)
+            assume_os = None if args.assume_os == "auto" else OSType[args.assume_os.upper()]
+            result = analyzer.analyze(args.dump, args.level, use_color, args.force,
+                                      args.legacy_hashes, args.blake3, args.cache, keep_raw,
+                                      assume_os, args.in_process)
             
             print("\n\n" + "="*70)
             print("ANALYSIS COMPLETE")
@@ -1619,8 +2505,7 @@ Examples:
 
             if args.json_out:
                 try:
-                    with open(args.json_out, "w", encoding="utf-8") as f:
-                        json.dump(result, f, indent=2, ensure_ascii=False)
+                    write_json_report(result, args.json_out)
                     print(f"\n[+] Full report saved -> {args.json_out}")
                 except Exception as e:
                     print(f"\n[!] Failed to save JSON report: {e}", file=sys.stderr)
@@ -1638,6 +2523,22 @@ Examples:
         sys.exit(1)
 
 
+def write_json_report(result: Dict[str, Any], path: str) -> None:
+    """
+    Write an analysis result as indented UTF-8 JSON.
+    
+    Uses orjson when it is installed (several times faster on large
+    reports), falling back to the standard json module; the output is
+    the same JSON either way.
+    """
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(result, f, indent=2, ensure_ascii=False)
+
+
 def _print_summary(result: Dict[str, Any], verbose: bool = False, use_color: bool = True) -> None:
     """Print formatted summary of analysis results with color support."""
     
@@ -1651,9 +2552,14 @@ def _print_summary(result: Dict[str, Any], verbose: bool = False, use_color: boo
         print(f"  Format: {file_info['format']['type']} ({file_info['format']['confidence']}% confidence)")
         if file_info['format']['compressed']:
             print(f"  Compression: Detected")
-        print(f"  MD5:    {file_info['hashes']['md5']}")
-        print(f"  SHA1:   {file_info['hashes']['sha1']}")
-        print(f"  SHA256: {file_info['hashes']['sha256']}")
+        if 'md5' in file_info['hashes']:
+            print(f"  MD5:    {file_info['hashes']['md5']}")
+        if 'sha1' in file_info['hashes']:
+            print(f"  SHA1:   {file_info['hashes']['sha1']}")
+        if 'sha256' in file_info['hashes']:
+            print(f"  SHA256: {file_info['hashes']['sha256']}")
+        if 'blake3' in file_info['hashes']:
+            print(f"  BLAKE3: {file_info['hashes']['blake3']}")
         
         # OS Detection
         print("\n[OS DETECTION]")
@@ -186,6 +186,24 @@ _KNOWN_GOOD_DLL_PREFIXES = (
     "c:\\program files (x86)\\",
 )
 
+# Volatility table column separator: tabs or runs of 2+ spaces
+_COLUMN_SPLIT_RE = re.compile(r"\t+|\s{2,}")
+
+# malfind: entry header, RWX protection flag, and MZ header in the hex dump
+_MALFIND_BLOCK_RE = re.compile(
+    r"Process:\s+(\S+)\s+Pid:\s+(\d+)\s+Address:\s+(0x[0-9a-fA-F]+)",
+    re.IGNORECASE,
+)
+_RWX_RE = re.compile(r"PAGE_EXECUTE_READWRITE", re.IGNORECASE)
+_PE_MAGIC_RE = re.compile(r"4d\s*5a|MZ", re.IGNORECASE)
+
+# dlllist: per-process header and DLL table rows (offset  size  wow  <name>  <path>)
+_DLL_PROC_HEADER_RE = re.compile(r"Process:\s+(\S+)\s+Pid:\s+(\d+)", re.IGNORECASE)
+_DLL_LINE_RE = re.compile(
+    r"0x[0-9a-fA-F]+\s+0x[0-9a-fA-F]+\s+(?:True|False)\s+(\S+)\s+(.*)",
+    re.IGNORECASE,
+)
+
 
 # ---------------------------------------------------------------------------
 # Rule implementations
@@ -303,7 +321,7 @@ def detect_hidden_processes(
             line = line.strip()
             if not line or line.startswith("Volatility") or "PID" in line:
                 continue
-            parts = re.split(r"\t+|\s{2,}", line)
+            parts = _COLUMN_SPLIT_RE.split(line)
             if len(parts) >= 3:
                 try:
                     pid  = int(parts[0])
@@ -375,13 +393,6 @@ def detect_injected_memory(
     # malfind output groups entries separated by blank lines; each has a header
     # like: "Process:  <name>  Pid: <pid>  Address: <addr>  Vad Tag: ..."
     # followed by protection flags and hex dump lines
-    block_re   = re.compile(
-        r"Process:\s+(\S+)\s+Pid:\s+(\d+)\s+Address:\s+(0x[0-9a-fA-F]+)",
-        re.IGNORECASE,
-    )
-    rwx_re     = re.compile(r"PAGE_EXECUTE_READWRITE", re.IGNORECASE)
-    pe_magic_re = re.compile(r"4d\s*5a|MZ", re.IGNORECASE)  # MZ header
-
     current_block = []
     entries: List[Dict[str, str]] = []
 
@@ -389,7 +400,7 @@ def detect_injected_memory(
         if not line.strip():
             if current_block:
                 block_text = "\n".join(current_block)
-                m = block_re.search(block_text)
+                m = _MALFIND_BLOCK_RE.search(block_text)
                 if m:
                     entries.append({
                         "name":    m.group(1),
@@ -404,7 +415,7 @@ def detect_injected_memory(
     # Flush last block
     if current_block:
         block_text = "\n".join(current_block)
-        m = block_re.search(block_text)
+        m = _MALFIND_BLOCK_RE.search(block_text)
         if m:
             entries.append({
                 "name":    m.group(1),
@@ -415,8 +426,8 @@ def detect_injected_memory(
 
     for entry in entries:
         text     = entry["text"]
-        has_rwx  = bool(rwx_re.search(text))
-        has_pe   = bool(pe_magic_re.search(text))
+        has_rwx  = bool(_RWX_RE.search(text))
+        has_pe   = bool(_PE_MAGIC_RE.search(text))
 
         if has_rwx and has_pe:
             severity   = Severity.CRITICAL
@@ -572,14 +583,6 @@ def detect_suspicious_dlls(
     # Parse dlllist: lines following a "Process:" header contain Base, Size, Name, Path
     # Format: "0x.... 0x.... True/False <name>  <path>"
     current_proc = {"name": "unknown", "pid": "0"}
-    proc_header_re = re.compile(
-        r"Process:\s+(\S+)\s+Pid:\s+(\d+)", re.IGNORECASE
-    )
-    # Match lines that look like DLL table rows (offset  size  wow  <name>  <path>)
-    dll_line_re = re.compile(
-        r"0x[0-9a-fA-F]+\s+0x[0-9a-fA-F]+\s+(?:True|False)\s+(\S+)\s+(.*)",
-        re.IGNORECASE,
-    )
 
     seen_paths: set = set()
 
@@ -587,12 +590,12 @@ def detect_suspicious_dlls(
         line = line.strip()
 
         # Track current process context
-        pm = proc_header_re.search(line)
+        pm = _DLL_PROC_HEADER_RE.search(line)
         if pm:
             current_proc = {"name": pm.group(1), "pid": pm.group(2)}
             continue
 
-        dm = dll_line_re.match(line)
+        dm = _DLL_LINE_RE.match(line)
         if not dm:
             continue
 
@@ -866,7 +869,7 @@ def detect_suspicious_services(
         if not header_seen:
             continue
 
-        parts = re.split(r"\t+|\s{2,}", line)
+        parts = _COLUMN_SPLIT_RE.split(line)
         if len(parts) < 4:
             continue
 
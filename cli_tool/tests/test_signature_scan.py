@@ -0,0 +1,68 @@
+"""
+OS signature scanning: the Aho-Corasick and find() scanners must agree.
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import memflow_cli_v2 as memflow  # noqa: E402
+
+
+def _scan(sample, automaton):
+    """Run _scan_signatures with the given automaton (None selects find())"""
+    saved = memflow._SIGNATURE_AUTOMATON
+    memflow._SIGNATURE_AUTOMATON = automaton
+    try:
+        return memflow._scan_signatures(sample, len(sample))
+    finally:
+        memflow._SIGNATURE_AUTOMATON = saved
+
+
+def _self_overlapping_sample():
+    # Self-overlapping signatures repeated back to back, including one run
+    # that straddles a HEURISTIC_WINDOW_SIZE boundary
+    chains = [b"/etc/etc/etc/etc/", b"/usr/bin/usr/bin/usr/bin/", b"\\Windows\\Windows\\Windows\\"]
+    sample = bytearray(b"\x00" * (memflow.HEURISTIC_WINDOW_SIZE * 2))
+    pos = 16
+    for chain in chains:
+        sample[pos:pos + len(chain)] = chain
+        pos += len(chain) + 16
+    straddle = memflow.HEURISTIC_WINDOW_SIZE - 6
+    chain = b"/etc/etc/etc/"
+    sample[straddle:straddle + len(chain)] = chain
+    return bytes(sample)
+
+
+def test_find_scanner_counts_like_bytes_count():
+    sample = _self_overlapping_sample()
+    hits = _scan(sample, None)
+    for sig in memflow.ALL_OS_SIGNATURES:
+        count = sample.count(sig)
+        if count:
+            assert hits[sig] == (count, sample.find(sig))
+        else:
+            assert sig not in hits
+
+
+def test_aho_corasick_scanner_matches_find_scanner():
+    pytest.importorskip("ahocorasick")
+    automaton = memflow._build_signature_automaton()
+    sample = _self_overlapping_sample()
+
+    ac_hits = _scan(sample, automaton)
+    find_hits = _scan(sample, None)
+
+    assert ac_hits == find_hits
+    assert memflow._family_scores(ac_hits, len(sample)) == \
+        memflow._family_scores(find_hits, len(sample))
+
+
+def test_overlapping_etc_example():
+    sample = b"/etc/etc/etc/etc/" + b"\x00" * 64
+    find_hits = _scan(sample, None)
+    assert find_hits[b"/etc/"][0] == sample.count(b"/etc/")
+    if memflow.ahocorasick is not None:
+        assert _scan(sample, memflow._build_signature_automaton()) == find_hits